@@ -90,7 +90,7 @@ class HistogramPlot(HistogramExporter):
         ("ping_pong", "recipes/recipe.yaml", "recipes/conditions.yaml"),
         ("alarm", "recipes/recipe.yaml", "recipes/conditions.yaml"),
         ("ring", "recipes/recipe.yaml", "recipes/conditions.yaml"),
-        ("safe_read", "recipes/recipe.yaml", "recipes/conditions.yaml"),
+        ("safe_send", "recipes/recipe.yaml", "recipes/conditions.yaml"),
         ("traffic_light", "recipes/recipe.yaml", "recipes/conditions.yaml"),
         ("train_door", "recipes/recipe.yaml", "recipes/conditions.yaml"),
     ],
@@ -0,0 +1,64 @@
+"""Micro-benchmark of the serialization of Frost messages.
+
+The benchmark compares the FrostCodec binary codec with pickle on batches of variable
+update messages, reporting the encoding and decoding throughput and the encoded size.
+
+Usage:
+    python bench_codec.py [--messages N] [--repeat R]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src", "python_lib"))
+
+from frost_codec import FrostCodec
+from machine_data_model.protocols.frost_v1.frost_message import FrostMessage
+from machine_data_model.protocols.frost_v1.frost_header import MsgType, MsgNamespace, FrostHeader, VariableMsgName
+from machine_data_model.protocols.frost_v1.frost_payload import VariablePayload
+
+
+def create_messages(n: int) -> list:
+    return [
+        FrostMessage(
+            sender="producer",
+            target="consumer",
+            identifier=f"producer:{i}",
+            header=FrostHeader(
+                type=MsgType.RESPONSE,
+                version=(1, 0, 0),
+                namespace=MsgNamespace.VARIABLE,
+                msg_name=VariableMsgName.UPDATE,
+            ),
+            payload=VariablePayload(node=f"Machine/Variable{i % 16}", value=i * 0.5),
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10_000, help="number of messages per batch")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    messages = create_messages(args.messages)
+    codec = FrostCodec()
+    cases = (
+        ("pickle", lambda: pickle.dumps(messages, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("FrostCodec", lambda: codec.encode_batch(messages), codec.decode_batch),
+    )
+
+    print(f"{'case':<12} {'encode msg/s':>14} {'decode msg/s':>14} {'bytes/message':>14}")
+    for name, encode, decode in cases:
+        data = encode()
+        encode_time = min(timeit.repeat(encode, number=1, repeat=args.repeat))
+        decode_time = min(timeit.repeat(lambda: decode(data), number=1, repeat=args.repeat))
+        print(f"{name:<12} {args.messages / encode_time:>14.0f} {args.messages / decode_time:>14.0f} {len(data) / args.messages:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
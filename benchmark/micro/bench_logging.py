@@ -0,0 +1,126 @@
+"""Micro-benchmark of the per-message logging cost in the Frost reactor hot paths.
+
+The benchmark compares the eager f-string logging previously used by the reactors
+with the lazy ReactorLogger facade, with the reactor logger enabled (DEBUG) and
+disabled (WARNING). Records are written to an in-memory stream. It also compares the
+cost of formatting a record with the LFormatter and with the FastLFormatter.
+
+Usage:
+    python bench_logging.py [--messages N] [--repeat R]
+"""
+
+import argparse
+import io
+import logging
+import os
+import sys
+import timeit
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src", "python_lib"))
+
+from l_formatter import FastLFormatter, LFormatter
+from reactor_logger import get_reactor_logger
+from machine_data_model.protocols.frost_v1.frost_message import FrostMessage
+from machine_data_model.protocols.frost_v1.frost_header import MsgType, MsgNamespace, FrostHeader, VariableMsgName
+from machine_data_model.protocols.frost_v1.frost_payload import VariablePayload
+
+
+def create_messages(n: int) -> list:
+    return [
+        FrostMessage(
+            sender="producer",
+            target="consumer",
+            identifier=str(uuid.uuid4()),
+            header=FrostHeader(
+                type=MsgType.REQUEST,
+                version=(1, 0, 0),
+                namespace=MsgNamespace.VARIABLE,
+                msg_name=VariableMsgName.READ,
+            ),
+            payload=VariablePayload(node="Machine/Variable", value=i),
+        )
+        for i in range(n)
+    ]
+
+
+def eager(logger: logging.Logger, messages: list) -> None:
+    for message in messages:
+        logger.debug(f"Processing message: {message}")
+
+
+def lazy(logger, messages: list) -> None:
+    for message in messages:
+        logger.debug("Processing message: %s", message)
+
+
+def guarded(logger, messages: list) -> None:
+    debug_enabled = logger.debug_enabled
+    for message in messages:
+        if debug_enabled:
+            logger.debug("Processing message: %s", message)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10_000, help="number of messages per run")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    handler = logging.StreamHandler(io.StringIO())
+    plain_logger = logging.getLogger("bench.plain")
+    plain_logger.addHandler(handler)
+    plain_logger.propagate = False
+    reactor_logger = get_reactor_logger("bench.facade")
+    reactor_logger.logger.addHandler(handler)
+    reactor_logger.logger.propagate = False
+
+    messages = create_messages(args.messages)
+    cases = [
+        ("eager f-string", eager, plain_logger),
+        ("facade, lazy args", lazy, reactor_logger),
+        ("facade, guarded", guarded, reactor_logger),
+    ]
+
+    print(f"{'case':<20} {'level':<8} {'ns/message':>12}")
+    for level in ("DEBUG", "WARNING"):
+        plain_logger.setLevel(level)
+        reactor_logger.setLevel(level)
+        for name, function, logger in cases:
+            best = min(timeit.repeat(lambda: function(logger, messages), number=1, repeat=args.repeat))
+            print(f"{name:<20} {level:<8} {best / args.messages * 1e9:>12.1f}")
+
+    # The logical time changes every 10 records.
+    originals = [logging.LogRecord("bench.facade", logging.INFO, __file__, 0, "Processing message: %s", (i,), None) for i in range(args.messages)]
+    records = []
+    clock = iter(range(1 << 62))
+    elapsed = [0]
+
+    def logical_elapsed():
+        return elapsed[0] // 10
+
+    formatters = [
+        ("LFormatter", lambda: LFormatter(logical_elapsed)),
+        ("Fast, colors", lambda: FastLFormatter(logical_elapsed)),
+        ("Fast, plain", lambda: FastLFormatter(logical_elapsed, colors=False)),
+        ("Fast, JSON lines", lambda: FastLFormatter(logical_elapsed, json_lines=True)),
+    ]
+
+    def format_records(formatter):
+        for record in records:
+            elapsed[0] = next(clock)
+            formatter.format(record)
+
+    print(f"\n{'formatter':<20} {'ns/record':>21}")
+    for name, create in formatters:
+        formatter = create()
+        # LFormatter modifies the records, so each run formats fresh copies.
+        def copy_records():
+            records[:] = [logging.makeLogRecord(record.__dict__) for record in originals]
+
+        best = min(timeit.repeat(lambda: format_records(formatter), setup=copy_records, number=1, repeat=args.repeat))
+        print(f"{name:<20} {best / args.messages * 1e9:>21.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Micro-benchmark of the creation cost of Frost messages.
+
+The benchmark compares FrostMessage objects carrying random UUID identifiers with
+messages carrying the per-reactor counter identifiers of MessageIdGenerator, and reports
+the peak memory allocated to keep a window of messages alive.
+
+Usage:
+    python bench_messages.py [--messages N] [--repeat R]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src", "python_lib"))
+
+from message_ids import MessageIdGenerator
+from machine_data_model.protocols.frost_v1.frost_message import FrostMessage
+from machine_data_model.protocols.frost_v1.frost_header import MsgType, MsgNamespace, FrostHeader, VariableMsgName
+from machine_data_model.protocols.frost_v1.frost_payload import VariablePayload
+
+
+def create_messages(n: int, next_id) -> list:
+    return [
+        FrostMessage(
+            sender="producer",
+            target="consumer",
+            identifier=next_id(),
+            header=FrostHeader(
+                type=MsgType.REQUEST,
+                version=(1, 0, 0),
+                namespace=MsgNamespace.VARIABLE,
+                msg_name=VariableMsgName.READ,
+            ),
+            payload=VariablePayload(node="Machine/Variable"),
+        )
+        for _ in range(n)
+    ]
+
+
+def create_uuid_messages(n: int) -> list:
+    return create_messages(n, lambda: str(uuid.uuid4()))
+
+
+def create_counter_messages(n: int) -> list:
+    return create_messages(n, MessageIdGenerator("producer"))
+
+
+def peak_memory(function, n: int) -> int:
+    tracemalloc.start()
+    messages = function(n)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del messages
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10_000, help="number of messages per run")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    print(f"{'identifiers':<20} {'ns/message':>12} {'bytes/message':>14}")
+    for name, function in (("uuid4", create_uuid_messages), ("MessageIdGenerator", create_counter_messages)):
+        best = min(timeit.repeat(lambda: function(args.messages), number=1, repeat=args.repeat))
+        memory = peak_memory(function, args.messages)
+        print(f"{name:<20} {best / args.messages * 1e9:>12.1f} {memory / args.messages:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Micro-benchmark of the lookup of data model nodes.
+
+The benchmark compares the ``get_node`` method of the data model with the NodeIndex
+lookups by path and by integer handle, on all the nodes of a data model file.
+
+Usage:
+    python bench_node_lookup.py [--data-model PATH] [--lookups N] [--repeat R]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src", "python_lib"))
+
+from data_model_utils import iter_nodes
+from node_index import NodeIndex
+from machine_data_model.builder.data_model_builder import DataModelBuilder
+
+DEFAULT_DATA_MODEL = os.path.join(os.path.dirname(__file__), "..", "..", "test", "resources", "data_model", "test_frost_data_model", "machine.yml")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-model", default=DEFAULT_DATA_MODEL, help="data model file")
+    parser.add_argument("--lookups", type=int, default=100_000, help="number of lookups per run")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    data_model = DataModelBuilder().get_data_model(args.data_model)
+    paths = [path for path, _ in iter_nodes(data_model.root)]
+    lookups = (paths * (args.lookups // len(paths) + 1))[:args.lookups]
+
+    get_node = data_model.get_node
+    index = NodeIndex(data_model)
+    handles = [index.handle(path) for path in lookups]
+
+    cases = (
+        ("get_node", lambda: [get_node(path) for path in lookups]),
+        ("index (path)", lambda: [index.get_node(path) for path in lookups]),
+        ("index (handle)", lambda: [index.get_node(handle) for handle in handles]),
+    )
+
+    print(f"{'case':<16} {'ns/lookup':>12}")
+    for name, function in cases:
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f"{name:<16} {best / args.lookups * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Micro-benchmark of the streaming of high-rate numerical signals.
+
+The benchmark compares sending each sample as a variable update message, encoded and
+decoded with the FrostCodec, with appending the samples to a SignalBuffer and reading
+them back, both as a copy and as a zero-copy window, after a single watermark update.
+
+Usage:
+    python bench_signal.py [--samples N] [--block B] [--repeat R]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src", "python_lib"))
+
+from frost_codec import FrostCodec
+from signal_buffer import SignalBuffer
+from machine_data_model.protocols.frost_v1.frost_message import FrostMessage
+from machine_data_model.protocols.frost_v1.frost_header import MsgType, MsgNamespace, FrostHeader, VariableMsgName
+from machine_data_model.protocols.frost_v1.frost_payload import VariablePayload
+
+
+def update_message(value) -> FrostMessage:
+    return FrostMessage(
+        sender="machine",
+        target="consumer",
+        identifier="machine:0",
+        header=FrostHeader(
+            type=MsgType.RESPONSE,
+            version=(1, 0, 0),
+            namespace=MsgNamespace.VARIABLE,
+            msg_name=VariableMsgName.UPDATE,
+        ),
+        payload=VariablePayload(node="machine/vibration", value=value),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=100_000, help="number of samples")
+    parser.add_argument("--block", type=int, default=1000, help="number of samples appended at once")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    samples = array("d", (i * 0.5 for i in range(args.samples)))
+    blocks = [samples[i:i + args.block] for i in range(0, args.samples, args.block)]
+    codec = FrostCodec()
+
+    with tempfile.TemporaryDirectory() as directory:
+        writer = SignalBuffer(os.path.join(directory, "vibration.sig"), 4 * args.block, create=True)
+        reader = SignalBuffer(writer.path)
+
+        def messages():
+            codec.decode_batch(codec.encode_batch([update_message(value) for value in samples]))
+
+        def signal_copy():
+            for block in blocks:
+                written = writer.append(block)
+                codec.decode(codec.encode(update_message(written)))
+                reader.read(written - len(block), written)
+
+        def signal_window():
+            for block in blocks:
+                written = writer.append(block)
+                codec.decode(codec.encode(update_message(written)))
+                for segment in reader.window(written - len(block), written):
+                    segment.release()
+
+        print(f"{'case':<16} {'samples/s':>14}")
+        for name, case in (("messages", messages), ("signal copy", signal_copy), ("signal window", signal_window)):
+            elapsed = min(timeit.repeat(case, number=1, repeat=args.repeat))
+            print(f"{name:<16} {args.samples / elapsed:>14.0f}")
+
+        reader.close()
+        writer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Micro-benchmark of the startup cost of the data model reactors.
+
+The benchmark builds the data model of N reactors sharing the same data model file, with
+the DataModelBuilder and with load_data_model using the in-memory and the on-disk caches.
+It also reports the time needed to import the frost module.
+
+Usage:
+    python bench_startup.py [--data-model PATH] [--machines N] [--repeat R]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+PYTHON_LIB = os.path.join(os.path.dirname(__file__), "..", "..", "src", "python_lib")
+sys.path.insert(0, PYTHON_LIB)
+
+from data_model_cache import clear_data_model_cache, load_data_model
+from machine_data_model.builder.data_model_builder import DataModelBuilder
+
+DEFAULT_DATA_MODEL = os.path.join(os.path.dirname(__file__), "..", "..", "test", "resources", "data_model", "test_frost_data_model", "machine.yml")
+
+
+def import_time(module: str) -> float:
+    """Returns the time needed to import a module in a new interpreter, in seconds."""
+    script = f"import sys, time; sys.path.insert(0, {PYTHON_LIB!r}); start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    if result.returncode != 0:
+        return float("nan")
+    return float(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-model", default=DEFAULT_DATA_MODEL, help="data model file")
+    parser.add_argument("--machines", type=int, default=50, help="number of reactors sharing the data model file")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        def builder():
+            for _ in range(args.machines):
+                DataModelBuilder().get_data_model(args.data_model)
+
+        def memory_cache():
+            clear_data_model_cache()
+            for _ in range(args.machines):
+                load_data_model(args.data_model)
+
+        def disk_cache():
+            clear_data_model_cache()
+            for _ in range(args.machines):
+                load_data_model(args.data_model, cache_dir)
+
+        # Populate the on-disk cache.
+        load_data_model(args.data_model, cache_dir)
+
+        cases = (
+            ("builder", builder),
+            ("memory cache", memory_cache),
+            ("disk cache", disk_cache),
+        )
+
+        print(f"{'case':<16} {'ms/machine':>12}")
+        for name, function in cases:
+            best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+            print(f"{name:<16} {best / args.machines * 1e3:>12.3f}")
+
+    print(f"{'import frost':<16} {import_time('frost') * 1e3:>12.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
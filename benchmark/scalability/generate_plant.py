@@ -0,0 +1,347 @@
+"""Generator of synthetic Frost plants for the scalability benchmarks.
+
+A plant is made of N FrostMachine reactors and a load generator sending variable requests to
+them at a given rate, with a given mix of reads and writes. Machines are connected to a single
+FrostBus or, when the bus width is smaller than the number of components, split over bus
+segments linked to a backbone bus. The generator writes the LF program, the FROST_CONFIG file
+and the data models of the plant in a directory.
+
+Usage:
+    python generate_plant.py DIRECTORY [--machines N] [--width W] [--rate R] [--mix read=0.8,write=0.2]
+"""
+
+import argparse
+import json
+import os
+
+import yaml
+
+LIB_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src", "lib"))
+MESSAGE_KINDS = ("read", "write")
+
+MAIN_TEMPLATE = """target Python{{
+    fast: {fast},
+    timeout: {duration} s
+}}
+
+import FrostBus from "{lib}/FrostBus.lf"
+import FrostBusLink from "{lib}/FrostBusLink.lf"
+import FrostMachine from "{lib}/FrostMachine.lf"
+import FrostReactor from "{lib}/FrostReactor.lf"
+
+preamble{{=
+    import json
+    import random
+    import time
+    from frost import *
+=}}
+
+reactor Load(period = {period} nsec) extends FrostReactor{{
+    timer tick(0, period)
+    state targets = []
+    state mix = {{=[]=}}
+    state batch = 1
+    state results_path = ""
+    state _pending = {{={{}}=}}
+    state _latencies = []
+    state _sent = 0
+    state _next_target = 0
+    state _random = None
+    state _startup_time = 0.0
+    state _connected_time = None
+
+    reaction (startup){{=
+        self._startup_time = time.time()
+        self._random = random.Random(0)
+    =}}
+
+    reaction (connected_to_bus){{=
+        self._connected_time = time.time()
+    =}}
+
+    method _create_request(target, kind){{=
+        if kind == "write":
+            msg_name, payload = VariableMsgName.WRITE, VariablePayload(node="machine/value", value=self._sent)
+        else:
+            msg_name, payload = VariableMsgName.READ, VariablePayload(node="machine/value")
+        return FrostMessage(
+            sender=self.name,
+            target=target,
+            identifier=self._next_message_id(),
+            header=FrostHeader(
+                type=MsgType.REQUEST,
+                version=(1, 0, 0),
+                namespace=MsgNamespace.VARIABLE,
+                msg_name=msg_name,
+            ),
+            payload=payload,
+        )
+    =}}
+
+    reaction (tick) -> channel_out{{=
+        if not self.connected:
+            return
+
+        kinds = self._random.choices([kind for kind, _ in self.mix], [weight for _, weight in self.mix], k=self.batch)
+        messages = []
+        for kind in kinds:
+            target = self.targets[self._next_target]
+            self._next_target = (self._next_target + 1) % len(self.targets)
+            message = self._create_request(target, kind)
+            self._pending[message.correlation_id] = time.perf_counter_ns()
+            messages.append(message)
+        self._sent += len(messages)
+        self._set_channel_out_port(messages, channel_out)
+    =}}
+
+    reaction (message_filter.responses){{=
+        now = time.perf_counter_ns()
+        for bank_index, message in message_filter.responses.value:
+            start = self._pending.pop(message.correlation_id, None)
+            if start is not None:
+                self._latencies.append(now - start)
+    =}}
+
+    reaction (shutdown){{=
+        with open(self.results_path, "w") as results_file:
+            json.dump({{
+                "sent": self._sent,
+                "completed": len(self._latencies),
+                "latencies_ns": self._latencies,
+                "startup_time": self._startup_time,
+                "connected_time": self._connected_time,
+                "shutdown_time": time.time(),
+                "logical_elapsed_ns": lf.time.logical_elapsed(),
+            }}, results_file)
+    =}}
+}}
+
+main reactor{{
+{instances}
+
+{connections}
+}}
+"""
+
+
+def _bus_data_model(name: str) -> dict:
+    return {
+        "name": name,
+        "machine_category": "unknown",
+        "machine_type": "unknown",
+        "machine_model": "unknown",
+        "description": "",
+        "root": {
+            "name": "FrostBus",
+            "description": "",
+            "children": [
+                {"name": "#Machines", "description": "", "measure_unit": "NoneMeasureUnits.NONE", "initial_value": 0, "_tag": "NumericalVariableNode"},
+                {"name": "MachineInfo", "description": "", "_tag": "FolderNode"},
+            ],
+            "_tag": "FolderNode",
+        },
+    }
+
+
+def _machine_data_model(name: str) -> dict:
+    return {
+        "name": name,
+        "machine_category": "unknown",
+        "machine_type": "unknown",
+        "machine_model": "unknown",
+        "description": "",
+        "root": {
+            "name": "machine",
+            "description": "",
+            "children": [
+                {"name": "value", "description": "", "initial_value": 0, "_tag": "NumericalVariableNode"},
+            ],
+            "_tag": "FolderNode",
+        },
+    }
+
+
+def _dump_data_model(data_model: dict, path: str) -> None:
+    """Write a data model, tagging the nodes as expected by the DataModelBuilder (e.g., ``!!FolderNode``)."""
+
+    class Dumper(yaml.SafeDumper):
+        pass
+
+    class Node(dict):
+        pass
+
+    def represent_node(dumper, node):
+        node = dict(node)
+        tag = node.pop("_tag")
+        return dumper.represent_mapping(f"tag:yaml.org,2002:{tag}", node)
+
+    def tagged(value):
+        if isinstance(value, dict):
+            value = {key: tagged(item) for key, item in value.items()}
+            return Node(value) if "_tag" in value else value
+        if isinstance(value, list):
+            return [tagged(item) for item in value]
+        return value
+
+    Dumper.add_representer(Node, represent_node)
+    with open(path, "w") as data_model_file:
+        yaml.dump(tagged(data_model), data_model_file, Dumper=Dumper, sort_keys=False)
+
+
+def parse_mix(mix: str) -> list[tuple[str, float]]:
+    """Parse a message mix such as ``read=0.8,write=0.2``.
+
+    Args:
+        mix (str): The comma-separated list of message kinds and weights.
+    Returns:
+        list[tuple[str, float]]: The message kinds and their weights.
+    Raises:
+        ValueError: If a message kind is unknown or a weight is negative.
+    """
+    result = []
+    for item in mix.split(","):
+        kind, _, weight = item.partition("=")
+        kind = kind.strip()
+        if kind not in MESSAGE_KINDS:
+            raise ValueError(f"Invalid message kind {kind}, expected one of {MESSAGE_KINDS}.")
+        weight = float(weight or 1)
+        if weight < 0:
+            raise ValueError(f"Invalid weight {weight} for message kind {kind}.")
+        result.append((kind, weight))
+    return result
+
+
+def generate_plant(directory: str, machines: int, width: int = 0, rate: float = 1000, mix: str = "read=0.8,write=0.2", batch: int = 1, duration: int = 10, fast: bool = True) -> dict:
+    """Generate a plant in a directory.
+
+    Args:
+        directory (str): The output directory.
+        machines (int): The number of machines.
+        width (int): The maximum number of channels of a bus, 0 to connect all the components to a single bus.
+        rate (float): The number of load ticks per second of logical time.
+        mix (str): The mix of the requests, see ``parse_mix``.
+        batch (int): The number of requests sent at each tick.
+        duration (int): The duration of the execution, in seconds of logical time.
+        fast (bool): Whether the program runs in fast mode.
+    Returns:
+        dict: The description of the plant, with the paths of the program, of the configuration and of the output files.
+    Raises:
+        ValueError: If the parameters do not describe a valid plant.
+    """
+    if machines < 1:
+        raise ValueError("A plant needs at least one machine.")
+    if width and width < 3:
+        raise ValueError("A bus segment needs at least 3 channels: the uplink and two components.")
+
+    directory = os.path.abspath(directory)
+    data_model_dir = os.path.join(directory, "data_model")
+    os.makedirs(os.path.join(directory, "src"), exist_ok=True)
+    os.makedirs(data_model_dir, exist_ok=True)
+
+    machine_names = [f"machine_{index}" for index in range(machines)]
+    segmented = width and machines + 1 > width
+    per_segment = width - 1 if segmented else machines
+    segments = [machine_names[start:start + per_segment] for start in range(0, machines, per_segment)]
+
+    instances = ['    bus = new FrostBus(name="frost_bus", width={})'.format(len(segments) + 1 if segmented else machines + 1)]
+    instances.append('    load = new Load(name="load")')
+    connections = []
+    reactors = {
+        "frost_bus": {"logging_level": "WARNING", "parameters": {"data_model_path": os.path.join(data_model_dir, "frost_bus.yml")}},
+        "load": {
+            "logging_level": "WARNING",
+            "parameters": {
+                "targets": machine_names,
+                "mix": [list(item) for item in parse_mix(mix)],
+                "batch": batch,
+                "results_path": os.path.join(directory, "load.json"),
+            },
+        },
+    }
+    _dump_data_model(_bus_data_model("frost_bus"), os.path.join(data_model_dir, "frost_bus.yml"))
+
+    for name in machine_names:
+        instances.append(f'    {name} = new FrostMachine(name="{name}")')
+        reactors[name] = {"logging_level": "WARNING", "parameters": {"data_model_path": os.path.join(data_model_dir, f"{name}.yml")}}
+        _dump_data_model(_machine_data_model(name), os.path.join(data_model_dir, f"{name}.yml"))
+
+    if not segmented:
+        outputs = ["load"] + machine_names
+        connections.append(", ".join(f"{name}.channel_out" for name in outputs) + " -> bus.channel_in")
+        connections.append("bus.channel_out -> " + ", ".join(f"{name}.channel_in" for name in outputs))
+    else:
+        uplinks = []
+        for index, segment in enumerate(segments):
+            segment_name = f"segment_{index}"
+            instances.append(f'    {segment_name} = new FrostBus(name="{segment_name}", width={len(segment) + 1})')
+            instances.append(f"    link_{index} = new FrostBusLink()")
+            reactors[segment_name] = {
+                "logging_level": "WARNING",
+                "parameters": {
+                    "data_model_path": os.path.join(data_model_dir, f"{segment_name}.yml"),
+                    "uplink_index": 0,
+                    "uplink_name": "frost_bus",
+                },
+            }
+            _dump_data_model(_bus_data_model(segment_name), os.path.join(data_model_dir, f"{segment_name}.yml"))
+            for name in segment:
+                reactors[name]["parameters"]["bus_name"] = segment_name
+
+            connections.append(f"link_{index}.lower_out, " + ", ".join(f"{name}.channel_out" for name in segment) + f" -> {segment_name}.channel_in")
+            connections.append(f"{segment_name}.channel_out -> link_{index}.lower_in, " + ", ".join(f"{name}.channel_in" for name in segment))
+            uplinks.append(f"link_{index}")
+
+        connections.append("load.channel_out, " + ", ".join(f"{link}.upper_out" for link in uplinks) + " -> bus.channel_in")
+        connections.append("bus.channel_out -> load.channel_in, " + ", ".join(f"{link}.upper_in" for link in uplinks))
+
+    main_path = os.path.join(directory, "src", "Main.lf")
+    with open(main_path, "w") as main_file:
+        main_file.write(MAIN_TEMPLATE.format(
+            fast="true" if fast else "false",
+            duration=duration,
+            lib=os.path.relpath(LIB_DIR, os.path.dirname(main_path)),
+            period=max(int(1e9 / rate), 1),
+            instances="\n".join(instances),
+            connections="\n".join(f"    {connection}" for connection in connections),
+        ))
+
+    config_path = os.path.join(directory, "config.yml")
+    config = {
+        "time_precision": "NSECS",
+        "logging_level": "WARNING",
+        "instrumentation": {"enabled": True, "path": os.path.join(directory, "metrics.json"), "format": "json", "interval": None},
+        "data_model_cache": os.path.join(directory, "data_model_cache"),
+        "reactors": reactors,
+    }
+    with open(config_path, "w") as config_file:
+        yaml.safe_dump(config, config_file, sort_keys=False)
+
+    return {
+        "directory": directory,
+        "main": main_path,
+        "config": config_path,
+        "load_results": os.path.join(directory, "load.json"),
+        "metrics": os.path.join(directory, "metrics.json"),
+        "buses": ["frost_bus"] + ([f"segment_{index}" for index in range(len(segments))] if segmented else []),
+        "machines": machine_names,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directory", help="output directory")
+    parser.add_argument("--machines", type=int, default=10, help="number of machines")
+    parser.add_argument("--width", type=int, default=0, help="maximum number of channels of a bus, 0 for a single bus")
+    parser.add_argument("--rate", type=float, default=1000, help="load ticks per second of logical time")
+    parser.add_argument("--mix", default="read=0.8,write=0.2", help="mix of the requests")
+    parser.add_argument("--batch", type=int, default=1, help="requests sent at each tick")
+    parser.add_argument("--duration", type=int, default=10, help="duration in seconds of logical time")
+    parser.add_argument("--realtime", action="store_true", help="disable the fast mode")
+    args = parser.parse_args()
+
+    plant = generate_plant(args.directory, args.machines, args.width, args.rate, args.mix, args.batch, args.duration, not args.realtime)
+    print(json.dumps(plant, indent=2))
+
+
+if __name__ == "__main__":
+    main()
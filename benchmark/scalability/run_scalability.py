@@ -0,0 +1,273 @@
+"""Scalability benchmark of Frost plants.
+
+For each combination of the given parameters, the benchmark generates a plant (see
+``generate_plant.py``), compiles it with ``lfc`` and runs it with the instrumentation enabled.
+It reports:
+
+- the throughput, i.e., the number of messages routed by the buses per second of wall time;
+- the percentiles of the request round-trip latency;
+- the percentiles of the latency per hop, i.e., the routing delay of the messages measured by each bus, in total and per bus;
+- the peak resident set size of the process;
+- the startup time, i.e., the wall time between the launch of the process and the registration of the load generator;
+- the reaction time spent in the FrostBus, MessageFilter and FrostDataModel reactors.
+
+The results are saved in a timestamped JSON file, which can be compared with a previous run.
+
+Usage:
+    python run_scalability.py [--machines 10,50,100] [--width 0,16] [--rate 1000] [--mix read=0.8,write=0.2]
+                              [--duration 10] [--output results] [--compare results/PREVIOUS.json]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from generate_plant import generate_plant
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values: list, q: float) -> float:
+    """Returns the q-th percentile of a sorted list, with linear interpolation."""
+    if not values:
+        return float("nan")
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def histogram_percentile(buckets: dict, q: float) -> float:
+    """Returns the upper bound of the bucket containing the q-th percentile of an instrumentation histogram."""
+    bounds = sorted((int(bound), count) for bound, count in buckets.items())
+    total = sum(count for _, count in bounds)
+    if not total:
+        return float("nan")
+    threshold = total * q / 100
+    seen = 0
+    for bound, count in bounds:
+        seen += count
+        if seen >= threshold:
+            return bound
+    return bounds[-1][0]
+
+
+def summarize_reactors(metrics: dict, names) -> dict:
+    """Merge the reaction histograms of a group of reactors.
+
+    Args:
+        metrics (dict): The snapshot of the metrics registry.
+        names (Iterable[str]): The names of the reactors of the group.
+    Returns:
+        dict: The number of reactions, the total and mean time and the 99th percentile, in microseconds.
+    """
+    count = total = 0
+    buckets = {}
+    for name in names:
+        for histogram in metrics["reactors"].get(name, {}).get("reactions", {}).values():
+            count += histogram["count"]
+            total += histogram["total_ns"]
+            for bound, bucket_count in histogram["buckets"].items():
+                buckets[bound] = buckets.get(bound, 0) + bucket_count
+    return {
+        "reactions": count,
+        "total_ms": total / 1e6,
+        "mean_us": total / count / 1e3 if count else float("nan"),
+        "p99_us": histogram_percentile(buckets, 99) / 1e3,
+    }
+
+
+def summarize_routing_delays(metrics: dict, buses) -> dict:
+    """Merge the routing-delay histograms of the buses.
+
+    The percentiles are the upper bounds of the power-of-two buckets of the histograms.
+
+    Args:
+        metrics (dict): The snapshot of the metrics registry.
+        buses (Iterable[str]): The names of the buses.
+    Returns:
+        dict: The percentiles of the routing delay of all the buses and of each bus, in microseconds.
+    """
+    buckets = {}
+    per_bus = {}
+    for bus in buses:
+        histogram = metrics["reactors"].get(bus, {}).get("histograms", {}).get("routing_delay")
+        if histogram is None:
+            continue
+        for bound, bucket_count in histogram["buckets"].items():
+            buckets[bound] = buckets.get(bound, 0) + bucket_count
+        per_bus[bus] = {f"p{q}": histogram_percentile(histogram["buckets"], q) / 1e3 for q in PERCENTILES}
+    return {
+        **{f"p{q}": histogram_percentile(buckets, q) / 1e3 for q in PERCENTILES},
+        "buses": per_bus,
+    }
+
+
+def run_plant(lfc: str, plant: dict, timeout: float) -> dict:
+    """Compile and run a generated plant.
+
+    Args:
+        lfc (str): The LF compiler command.
+        plant (dict): The description of the plant returned by ``generate_plant``.
+        timeout (float): The maximum wall time of the execution, in seconds.
+    Returns:
+        dict: The measurements of the execution.
+    Raises:
+        RuntimeError: If the compilation or the execution fails.
+    """
+    directory = plant["directory"]
+    compilation = subprocess.run([lfc, plant["main"]], cwd=directory, capture_output=True, text=True)
+    if compilation.returncode != 0:
+        raise RuntimeError(f"Compilation of {plant['main']} failed:\n{compilation.stdout}{compilation.stderr}")
+
+    environment = dict(os.environ, FROST_CONFIG=plant["config"])
+    log_path = os.path.join(directory, "run.log")
+    with open(log_path, "w") as log_file:
+        launch_time = time.time()
+        process = subprocess.Popen([os.path.join(directory, "bin", "Main")], cwd=directory, env=environment, stdout=log_file, stderr=subprocess.STDOUT)
+        watchdog = threading.Timer(timeout, process.kill)
+        watchdog.start()
+        # wait4 returns the resource usage of this process only, not of the compiler.
+        _, status, usage = os.wait4(process.pid, 0)
+        end_time = time.time()
+        watchdog.cancel()
+    exit_code = os.waitstatus_to_exitcode(status)
+    if exit_code != 0:
+        raise RuntimeError(f"Execution of {plant['main']} failed with code {exit_code}, see {log_path}.")
+
+    with open(plant["load_results"]) as load_file:
+        load = json.load(load_file)
+    with open(plant["metrics"]) as metrics_file:
+        metrics = json.load(metrics_file)
+
+    connected_time = load["connected_time"] or end_time
+    run_time = max(load["shutdown_time"] - connected_time, 1e-9)
+    routed = sum(metrics["reactors"].get(bus, {}).get("counters", {}).get("routed", 0) for bus in plant["buses"])
+    latencies = sorted(load["latencies_ns"])
+
+    return {
+        "wall_time_s": end_time - launch_time,
+        "startup_time_s": connected_time - launch_time,
+        "peak_rss_mb": usage.ru_maxrss / 1024,
+        "requests_sent": load["sent"],
+        "requests_completed": load["completed"],
+        "messages_routed": routed,
+        "throughput_msg_s": routed / run_time,
+        "latency_us": {f"p{q}": percentile(latencies, q) / 1e3 for q in PERCENTILES},
+        "hop_latency_us": summarize_routing_delays(metrics, plant["buses"]),
+        "FrostBus": summarize_reactors(metrics, plant["buses"]),
+        "MessageFilter": summarize_reactors(metrics, [f"{name}.message_filter" for name in plant["buses"] + plant["machines"]]),
+        "FrostDataModel": summarize_reactors(metrics, plant["machines"]),
+    }
+
+
+def configuration_key(configuration: dict) -> tuple:
+    return tuple(configuration[key] for key in ("machines", "width", "rate", "mix", "batch", "duration", "fast"))
+
+
+def compare(results: list, previous_path: str) -> None:
+    """Print the relative change of the main measurements with respect to a previous run."""
+    with open(previous_path) as previous_file:
+        previous = {configuration_key(result["configuration"]): result for result in json.load(previous_file)["results"]}
+
+    print(f"\nComparison with {previous_path}:")
+    print(f"{'machines':>8} {'width':>6} {'rate':>8} {'throughput':>12} {'p99 latency':>12} {'peak RSS':>10} {'startup':>10}")
+    for result in results:
+        old = previous.get(configuration_key(result["configuration"]))
+        if old is None or "error" in result or "error" in old:
+            continue
+
+        def change(new_value, old_value):
+            return f"{(new_value / old_value - 1) * 100:+.1f}%" if old_value else "n/a"
+
+        configuration = result["configuration"]
+        print(
+            f"{configuration['machines']:>8} {configuration['width']:>6} {configuration['rate']:>8g} "
+            f"{change(result['throughput_msg_s'], old['throughput_msg_s']):>12} "
+            f"{change(result['latency_us']['p99'], old['latency_us']['p99']):>12} "
+            f"{change(result['peak_rss_mb'], old['peak_rss_mb']):>10} "
+            f"{change(result['startup_time_s'], old['startup_time_s']):>10}"
+        )
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    def int_list(value):
+        return [int(item) for item in value.split(",")]
+
+    def float_list(value):
+        return [float(item) for item in value.split(",")]
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--machines", type=int_list, default=[10, 50, 100], help="comma-separated numbers of machines")
+    parser.add_argument("--width", type=int_list, default=[0], help="comma-separated maximum bus widths, 0 for a single bus")
+    parser.add_argument("--rate", type=float_list, default=[1000], help="comma-separated load ticks per second of logical time")
+    parser.add_argument("--mix", action="append", help="mix of the requests, can be repeated (default: read=0.8,write=0.2)")
+    parser.add_argument("--batch", type=int_list, default=[1], help="comma-separated numbers of requests per tick")
+    parser.add_argument("--duration", type=int, default=10, help="duration in seconds of logical time")
+    parser.add_argument("--realtime", action="store_true", help="disable the fast mode")
+    parser.add_argument("--timeout", type=float, default=600, help="maximum wall time of each execution, in seconds")
+    parser.add_argument("--lfc", default="lfc", help="LF compiler command")
+    parser.add_argument("--work-dir", help="directory of the generated plants (default: a temporary directory)")
+    parser.add_argument("--output", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "results"), help="directory of the result files")
+    parser.add_argument("--compare", help="result file of a previous run to compare with")
+    args = parser.parse_args()
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="frost-scalability-")
+    results = []
+    for machines, width, rate, mix, batch in itertools.product(args.machines, args.width, args.rate, args.mix or ["read=0.8,write=0.2"], args.batch):
+        configuration = {"machines": machines, "width": width, "rate": rate, "mix": mix, "batch": batch, "duration": args.duration, "fast": not args.realtime}
+        name = f"m{machines}_w{width}_r{rate:g}_b{batch}_{mix.replace('=', '').replace(',', '_')}"
+        print(f"Running {name}...", flush=True)
+
+        plant = generate_plant(os.path.join(work_dir, name), machines, width, rate, mix, batch, args.duration, not args.realtime)
+        try:
+            result = run_plant(args.lfc, plant, args.timeout)
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            result = {"error": str(e)}
+        results.append({"configuration": configuration, **result})
+
+    os.makedirs(args.output, exist_ok=True)
+    output_path = os.path.join(args.output, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(output_path, "w") as output_file:
+        json.dump({
+            "timestamp": time.time(),
+            "revision": git_revision(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "results": results,
+        }, output_file, indent=2)
+
+    print(f"\n{'machines':>8} {'width':>6} {'rate':>8} {'msg/s':>12} {'p50 us':>10} {'p99 us':>10} {'hop p99 us':>10} {'RSS MB':>8} {'startup s':>10}")
+    for result in results:
+        configuration = result["configuration"]
+        if "error" in result:
+            print(f"{configuration['machines']:>8} {configuration['width']:>6} {configuration['rate']:>8g} failed")
+            continue
+        print(
+            f"{configuration['machines']:>8} {configuration['width']:>6} {configuration['rate']:>8g} "
+            f"{result['throughput_msg_s']:>12.0f} {result['latency_us']['p50']:>10.1f} {result['latency_us']['p99']:>10.1f} "
+            f"{result['hop_latency_us']['p99']:>10.1f} {result['peak_rss_mb']:>8.1f} {result['startup_time_s']:>10.2f}"
+        )
+    print(f"\nResults saved to {output_path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+from machine_data_model.protocols.frost_v1.frost_message import FrostMessage
+from machine_data_model.protocols.frost_v1.frost_header import MsgType, MsgNamespace, FrostHeader, MethodMsgName, VariableMsgName
+from machine_data_model.protocols.frost_v1.frost_payload import ErrorPayload, ErrorCode, ErrorMessages, VariablePayload, MethodPayload
+
+# Operations that can be batched, with their namespace.
+BATCH_OPERATIONS = {
+    VariableMsgName.READ: MsgNamespace.VARIABLE,
+    VariableMsgName.WRITE: MsgNamespace.VARIABLE,
+    MethodMsgName.INVOKE: MsgNamespace.METHOD,
+}
+# Payload type of the operations of each namespace.
+_BATCH_PAYLOADS = {
+    MsgNamespace.VARIABLE: VariablePayload,
+    MsgNamespace.METHOD: MethodPayload,
+}
+
+
+class BatchPayload:
+    """Payload carrying several variable reads and writes and method invocations in a single message.
+
+    In a request, each item is a ``(msg_name, payload)`` pair, e.g.,
+    ``(VariableMsgName.READ, VariablePayload(node="machine/temperature"))``. In the response,
+    each item is a ``(msg_type, msg_name, payload)`` triple with the outcome of the operation
+    at the same position: ``MsgType.RESPONSE`` and the payload of the response, or
+    ``MsgType.ERROR`` and an ``ErrorPayload``.
+
+    Args:
+        items (Iterable[tuple] | None): The items of the batch.
+    """
+
+    def __init__(self, items=None) -> None:
+        self.items = list(items or ())
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, BatchPayload) and self.items == other.items
+
+    def __repr__(self) -> str:
+        return f"BatchPayload(items={self.items!r})"
+
+
+def _batch_operation(item):
+    """Returns the namespace, the name and the payload of an item of a batch request.
+
+    Args:
+        item (tuple): The ``(msg_name, payload)`` pair of the operation.
+    Returns:
+        tuple[MsgNamespace, Enum, object] | None: The operation, None if the item is malformed or its operation cannot be batched.
+    """
+    if not isinstance(item, (tuple, list)) or len(item) != 2:
+        return None
+
+    msg_name, payload = item
+    namespace = BATCH_OPERATIONS.get(msg_name) if isinstance(msg_name, (VariableMsgName, MethodMsgName)) else None
+    if namespace is None or not isinstance(payload, _BATCH_PAYLOADS[namespace]):
+        return None
+    return namespace, msg_name, payload
+
+
+def create_batch_request(sender: str, target: str, identifier: str, items) -> FrostMessage:
+    """Create a request carrying a batch of operations.
+
+    Args:
+        sender (str): The name of the sender.
+        target (str): The name of the target.
+        identifier (str): The identifier of the request.
+        items (Iterable[tuple[Enum, object]]): The ``(msg_name, payload)`` pairs of the operations.
+    Returns:
+        FrostMessage: The request. Its header carries the namespace and the name of the first operation.
+    Raises:
+        ValueError: If the batch is empty, an item is malformed or an operation cannot be batched.
+    """
+    payload = BatchPayload(items)
+    if not payload.items:
+        raise ValueError("A batch request needs at least one operation.")
+    for item in payload.items:
+        if _batch_operation(item) is None:
+            raise ValueError(f"Invalid batch item {item!r}, expected a (msg_name, payload) pair with one of {tuple(BATCH_OPERATIONS)}.")
+
+    msg_name = payload.items[0][0]
+    return FrostMessage(
+        sender=sender,
+        target=target,
+        identifier=identifier,
+        header=FrostHeader(
+            type=MsgType.REQUEST,
+            version=(1, 0, 0),
+            namespace=BATCH_OPERATIONS[msg_name],
+            msg_name=msg_name,
+        ),
+        payload=payload,
+    )
+
+
+def split_batch_request(message: FrostMessage) -> list:
+    """Split a batch request in the requests of its operations.
+
+    Args:
+        message (FrostMessage): The batch request.
+    Returns:
+        list[FrostMessage | None]: The requests, with the sender and the target of the batch, and None for the malformed items and the operations that cannot be batched.
+    """
+    requests = []
+    for index, item in enumerate(message.payload.items):
+        operation = _batch_operation(item)
+        if operation is None:
+            requests.append(None)
+            continue
+
+        namespace, msg_name, payload = operation
+        requests.append(FrostMessage(
+            sender=message.sender,
+            target=message.target,
+            identifier=f"{message.identifier}.{index}",
+            header=FrostHeader(
+                type=MsgType.REQUEST,
+                version=message.header.version,
+                namespace=namespace,
+                msg_name=msg_name,
+            ),
+            payload=payload,
+        ))
+    return requests
+
+
+def merge_batch_responses(message: FrostMessage, responses: list, sender: str, identifier: str) -> FrostMessage:
+    """Combine the responses to the operations of a batch request in a single response.
+
+    Args:
+        message (FrostMessage): The batch request.
+        responses (list[FrostMessage | None]): The responses to the operations, None for the operations that were not executed, which are reported as bad requests.
+        sender (str): The name of the sender of the response.
+        identifier (str): The identifier of the response.
+    Returns:
+        FrostMessage: The response, correlated to the batch request.
+    """
+    items = []
+    for item, response in zip(message.payload.items, responses):
+        if response is None:
+            # The name of the operation of a malformed item is replaced by the one of the batch.
+            msg_name = item[0] if isinstance(item, (tuple, list)) and len(item) == 2 else message.header.msg_name
+            items.append((MsgType.ERROR, msg_name, ErrorPayload(error_code=ErrorCode.BAD_REQUEST, error_message=ErrorMessages.BAD_REQUEST.value)))
+        else:
+            items.append((response.header.type, response.header.msg_name, response.payload))
+
+    response = FrostMessage(
+        sender=sender,
+        target=message.sender,
+        identifier=identifier,
+        header=FrostHeader(
+            type=MsgType.RESPONSE,
+            version=message.header.version,
+            namespace=message.header.namespace,
+            msg_name=message.header.msg_name,
+        ),
+        payload=BatchPayload(items),
+    )
+    response.correlation_id = message.correlation_id
+    return response
@@ -0,0 +1,145 @@
+import logging
+from typing import NamedTuple
+
+# Registers the custom levels accepted by the reactors, e.g., TRACE.
+import reactor_logger
+from time_utils import TimePrecision
+
+# Sections of the configuration file, and keys of the reactor sections.
+CONFIG_SECTIONS = ("time_precision", "logging_level", "log_format", "async_logging", "instrumentation", "profiling", "data_model_cache", "reactors")
+REACTOR_KEYS = ("logging_level", "parameters", "profile", "reactors")
+
+
+class ReactorConfig(NamedTuple):
+    """Settings of a reactor resolved from the configuration.
+
+    Attributes:
+        logging_level (str | int): The logging level, inherited from the parent reactor or from the configuration if not set.
+        parameters (dict): The parameters overriding the state of the reactor.
+        profile (bool): Whether the reactions of the reactor are profiled.
+    """
+
+    logging_level: str | int
+    parameters: dict
+    profile: bool
+
+
+class ConfigIndex:
+    """Index of the reactor sections of a FROST_CONFIG configuration by dotted reactor name.
+
+    The nested ``reactors`` sections are compiled once, so each reactor resolves its settings
+    with a single lookup instead of walking the configuration. The ``logging_level`` of a
+    section is inherited by the nested sections that do not set it. The configuration is
+    validated while it is compiled, and the problems found are collected in ``errors``.
+
+    Args:
+        configuration (dict): The configuration.
+
+    Attributes:
+        logging_level (str | int): The default logging level of the reactors.
+        errors (list[str]): The problems found in the configuration.
+    """
+
+    def __init__(self, configuration: dict) -> None:
+        self.errors: list[str] = []
+        self._entries: dict[str, ReactorConfig] = {}
+
+        if not isinstance(configuration, dict):
+            self.errors.append("The configuration must be a mapping.")
+            configuration = {}
+
+        for key in configuration:
+            if key not in CONFIG_SECTIONS:
+                self.errors.append(f"Unknown configuration section {key}, expected one of {CONFIG_SECTIONS}.")
+        if configuration.get("time_precision") not in TimePrecision.__members__:
+            self.errors.append(f"Invalid time_precision {configuration.get('time_precision')}, expected one of {tuple(TimePrecision.__members__)}.")
+
+        self.logging_level = self._logging_level(configuration.get("logging_level", "WARNING"), "the configuration") or "WARNING"
+        self._compile(configuration.get("reactors"), "", self.logging_level)
+
+    def get(self, name: str) -> ReactorConfig | None:
+        """Returns the settings of a reactor.
+
+        Args:
+            name (str): The dotted name of the reactor, e.g., ``machine.message_filter``.
+        Returns:
+            ReactorConfig | None: The settings, None if the reactor is not in the configuration.
+        """
+        return self._entries.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _compile(self, reactors, prefix: str, logging_level: str | int) -> None:
+        if reactors is None:
+            return
+        if not isinstance(reactors, dict):
+            self.errors.append(f"The reactors of {prefix or 'the configuration'} must be a mapping.")
+            return
+
+        for part, section in reactors.items():
+            name = f"{prefix}{part}"
+            section = section or {}
+            if not isinstance(section, dict):
+                self.errors.append(f"The configuration of reactor {name} must be a mapping.")
+                continue
+
+            for key in section:
+                if key not in REACTOR_KEYS:
+                    self.errors.append(f"Unknown key {key} in the configuration of reactor {name}, expected one of {REACTOR_KEYS}.")
+
+            parameters = section.get("parameters") or {}
+            if not isinstance(parameters, dict):
+                self.errors.append(f"The parameters of reactor {name} must be a mapping.")
+                parameters = {}
+
+            profile = section.get("profile", False)
+            if not isinstance(profile, bool):
+                self.errors.append(f"The profile flag of reactor {name} must be a boolean.")
+                profile = False
+
+            level = logging_level
+            if "logging_level" in section:
+                level = self._logging_level(section["logging_level"], f"reactor {name}") or logging_level
+
+            self._entries[name] = ReactorConfig(level, parameters, profile)
+            self._compile(section.get("reactors"), f"{name}.", level)
+
+    def _logging_level(self, level, owner: str) -> str | int | None:
+        """Returns the normalized logging level, None if it is invalid."""
+        if isinstance(level, int) and not isinstance(level, bool):
+            return level
+        if isinstance(level, str) and isinstance(logging.getLevelName(level.upper()), int):
+            return level.upper()
+        self.errors.append(f"Invalid logging level {level} in {owner}.")
+        return None
+
+
+def validate_config(path: str) -> list[str]:
+    """Validate a configuration file.
+
+    Args:
+        path (str): The path of the configuration file.
+    Returns:
+        list[str]: The problems found in the configuration, empty if it is valid.
+    """
+    import yaml
+
+    with open(path) as config_file:
+        configuration = yaml.load(config_file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    return ConfigIndex(configuration).errors
+
+
+if __name__ == "__main__":
+    import sys
+
+    failed = False
+    for path in sys.argv[1:]:
+        errors = validate_config(path)
+        for error in errors:
+            print(f"{path}: {error}")
+        failed = failed or bool(errors)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,99 @@
+import hashlib
+import logging
+import os
+import pickle
+import sys
+
+from machine_data_model.builder.data_model_builder import DataModelBuilder
+
+_logger = logging.getLogger(__name__)
+
+# Serialized data models of the current process, indexed by content hash.
+_built_models: dict[str, bytes | None] = {}
+
+
+def _library_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("machine_data_model")
+    except Exception:
+        return "unknown"
+
+
+_CACHE_SALT = f"{sys.version_info[:2]}:{_library_version()}:{pickle.HIGHEST_PROTOCOL}".encode()
+
+
+def data_model_key(path: str) -> str:
+    """Returns the cache key of a data model file, i.e., the hash of its content and of the versions of Python and of the data model library.
+
+    Args:
+        path (str): The path of the data model file.
+    Returns:
+        str: The cache key.
+    """
+    digest = hashlib.sha256(_CACHE_SALT)
+    with open(path, "rb") as model_file:
+        digest.update(model_file.read())
+    return digest.hexdigest()
+
+
+def load_data_model(path: str, cache_dir: str | None = None):
+    """Build the data model described by a file, reusing previous builds of the same content.
+
+    Each call returns a new, independent data model. Builds are kept in memory as pickles,
+    so reactors sharing a data model file build it only once, and are stored in
+    ``cache_dir``, if given, so that the next runs skip the YAML parsing and the tree
+    construction. Data models that cannot be pickled are built every time.
+
+    Args:
+        path (str): The path of the data model file.
+        cache_dir (str | None): The directory of the on-disk cache, None to disable it.
+    Returns:
+        DataModel: The data model.
+    """
+    key = data_model_key(path)
+    serialized = _built_models.get(key)
+
+    if serialized is None and key not in _built_models and cache_dir:
+        try:
+            with open(os.path.join(cache_dir, f"{key}.pickle"), "rb") as cache_file:
+                serialized = cache_file.read()
+            _built_models[key] = serialized
+        except OSError:
+            pass
+
+    if serialized is not None:
+        try:
+            return pickle.loads(serialized)
+        except Exception as e:
+            _logger.warning("Discarding the cached build of data model %s: %s", path, e)
+            _built_models[key] = None
+
+    data_model = DataModelBuilder().get_data_model(path)
+    if key in _built_models:
+        # The data model is known not to be picklable.
+        return data_model
+
+    try:
+        serialized = pickle.dumps(data_model, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        _logger.debug("Data model %s cannot be cached: %s", path, e)
+        _built_models[key] = None
+        return data_model
+
+    _built_models[key] = serialized
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = os.path.join(cache_dir, f"{key}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as cache_file:
+                cache_file.write(serialized)
+            os.replace(tmp_path, os.path.join(cache_dir, f"{key}.pickle"))
+        except OSError as e:
+            _logger.warning("Cannot write the data model cache in %s: %s", cache_dir, e)
+    return data_model
+
+
+def clear_data_model_cache() -> None:
+    """Clear the in-memory cache of the built data models."""
+    _built_models.clear()
@@ -0,0 +1,19 @@
+from machine_data_model.nodes.folder_node import FolderNode
+
+
+def iter_nodes(root):
+    """Iterate over the nodes of a data model tree in depth-first order.
+
+    Args:
+        root (DataModelNode): The root node of the tree.
+    Yields:
+        tuple[str, DataModelNode]: The path of the node, starting with the name of the root, and the node itself.
+    """
+    stack = [(root.name, root)]
+    while stack:
+        path, node = stack.pop()
+        yield path, node
+
+        if isinstance(node, FolderNode):
+            stack.extend((f"{path}/{child.name}", child) for child in reversed(list(node.children.values())))
+
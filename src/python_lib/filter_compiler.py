@@ -0,0 +1,120 @@
+from machine_data_model.protocols.frost_v1.frost_header import MsgType
+
+from routing import TOPIC_PREFIX
+
+
+class TargetFilter:
+    """Filter callback accepting the messages addressed to one of the given targets.
+
+    Targets are either names or zero-argument callables returning a name. Callables are
+    resolved when the filter is compiled, which allows to use names that are not known
+    when the filter is configured (e.g., the name stored in the data model of the reactor).
+    The CompiledFilter turns target filters into a single set lookup, while calling the
+    filter directly behaves as any other filter callback.
+
+    Args:
+        *targets (str | Callable[[], str]): The accepted targets.
+        topics (bool): If True, messages addressed to a topic are accepted as well. The bus only delivers topic messages to the subscribers of the topic.
+
+    Attributes:
+        topics (bool): Whether messages addressed to a topic are accepted.
+    """
+
+    __slots__ = ("_targets", "topics")
+
+    def __init__(self, *targets, topics: bool = False) -> None:
+        self._targets = targets
+        self.topics = topics
+
+    def targets(self) -> frozenset:
+        """Resolve the accepted targets.
+
+        Returns:
+            frozenset[str]: The names of the accepted targets.
+        """
+        return frozenset(target() if callable(target) else target for target in self._targets)
+
+    def __call__(self, message: tuple) -> bool:
+        target = message[1].target
+        return target in self.targets() or (self.topics and target.startswith(TOPIC_PREFIX))
+
+    def __repr__(self) -> str:
+        return f"TargetFilter{self._targets}"
+
+
+class CompiledFilter:
+    """Specialized predicate built from the message type and the filter callbacks of a MessageFilter.
+
+    Target filters are merged into one precomputed set of accepted targets, while any
+    other callable is kept as a slow path evaluated after the target check.
+
+    Args:
+        message_type (type): The type of messages to accept.
+        filter_callbacks (list[callable]): The filter callbacks to apply.
+
+    Attributes:
+        message_type (type): The type of messages to accept.
+        targets (frozenset[str] | None): The accepted targets, None if any target is accepted.
+        accept_topics (bool): Whether messages addressed to a topic are accepted by the target filters.
+        callbacks (tuple[callable]): The filter callbacks that could not be compiled.
+    """
+
+    def __init__(self, message_type: type, filter_callbacks) -> None:
+        targets = None
+        accept_topics = True
+        callbacks = []
+        for callback in filter_callbacks or ():
+            if isinstance(callback, TargetFilter):
+                callback_targets = callback.targets()
+                targets = callback_targets if targets is None else targets & callback_targets
+                accept_topics = accept_topics and callback.topics
+            else:
+                callbacks.append(callback)
+
+        self.message_type = message_type
+        self.targets = targets
+        self.accept_topics = accept_topics
+        self.callbacks = tuple(callbacks)
+
+    def partition(self, messages) -> tuple:
+        """Partition a batch of messages in a single pass.
+
+        Args:
+            messages (Iterable[tuple[int, FrostMessage]]): The messages to partition, as (bank index, message) tuples.
+        Returns:
+            tuple[list, list, list, list, list]: The requests, the responses, the errors, the messages that do
+                not match the filter criteria, and the invalid messages (i.e., messages of the wrong type or
+                with an unknown header type).
+        """
+        requests, responses, errors, discarded, invalid = [], [], [], [], []
+        routes = {
+            MsgType.REQUEST: requests.append,
+            MsgType.RESPONSE: responses.append,
+            MsgType.ERROR: errors.append,
+        }
+        message_type = self.message_type
+        targets = self.targets
+        accept_topics = self.accept_topics
+        callbacks = self.callbacks
+
+        for message in messages:
+            frost_message = message[1]
+            if type(frost_message) is not message_type and not isinstance(frost_message, message_type):
+                invalid.append(message)
+                continue
+
+            if targets is not None and frost_message.target not in targets and not (accept_topics and frost_message.target.startswith(TOPIC_PREFIX)):
+                discarded.append(message)
+                continue
+
+            if callbacks and not all(callback(message) for callback in callbacks):
+                discarded.append(message)
+                continue
+
+            append = routes.get(frost_message.header.type)
+            if append is None:
+                invalid.append(message)
+                continue
+            append(message)
+
+        return requests, responses, errors, discarded, invalid
@@ -6,14 +6,30 @@ import os
 import sys
 import importlib
 
-for file in os.listdir(os.path.dirname(__file__)):
-    if file.startswith("LinguaFranca") and file.endswith(".so"):
-        base_name = file[:-3]  
-        base_module = importlib.import_module(base_name)
-        break
+# The LF extension module is already imported by the generated program: look it up before scanning the directory.
+base_module = next((module for name, module in list(sys.modules.items()) if name.startswith("LinguaFranca")), None)
+if base_module is None:
+    for file in os.listdir(os.path.dirname(__file__)):
+        if file.startswith("LinguaFranca") and file.endswith(".so"):
+            base_name = file[:-3]  
+            base_module = importlib.import_module(base_name.split(".")[0])
+            break
 
 from time_utils import TimePrecision, convert_time_float, convert_time
-from l_formatter import LFormatter    
+from l_formatter import LFormatter, FastLFormatter
+from routing import RoutingTable, TOPIC_PREFIX, topic_name, to_topic_messages, is_topic
+from reactor_logger import ReactorLogger, get_reactor_logger, TRACE
+from filter_compiler import TargetFilter, CompiledFilter
+from data_model_utils import iter_nodes
+from update_coalescer import UpdateCoalescer
+from method_queue import MethodQueue
+from message_ids import MessageIdGenerator
+from message_batch import MessageBatch
+from batch_payload import BatchPayload, create_batch_request, split_batch_request, merge_batch_responses
+from signal_buffer import SignalBuffer, SignalOverrunError, signal_path
+from node_index import NodeIndex
+from data_model_cache import load_data_model
+from config_index import ConfigIndex, ReactorConfig
 from machine_data_model.protocols.frost_v1.frost_message import FrostMessage
 from machine_data_model.protocols.frost_v1.frost_header import MsgType, MsgNamespace, ProtocolMsgName, FrostHeader, MethodMsgName, VariableMsgName
 from machine_data_model.protocols.frost_v1.frost_payload import VariablePayload, ProtocolPayload, MethodPayload, ErrorPayload, SubscriptionPayload, ErrorMessages, ErrorCode
@@ -37,20 +53,39 @@ if not os.path.exists(FROST_CONFIG) or not os.path.isfile(FROST_CONFIG):
     }
 else:
     with open(FROST_CONFIG) as config_file:
-        FROST_CONFIG = yaml.safe_load(config_file)
+        FROST_CONFIG = yaml.load(config_file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+# compile the reactor sections once, rejecting invalid configurations before the plant starts
+CONFIG_INDEX = ConfigIndex(FROST_CONFIG)
+if CONFIG_INDEX.errors:
+    raise ValueError("Invalid Frost configuration:\n" + "\n".join(CONFIG_INDEX.errors))
 
 TIME_PRECISION = TimePrecision[FROST_CONFIG["time_precision"]]
 LOGGING_LEVEL = FROST_CONFIG["logging_level"].upper()
 
 # setup logging
+# "text" lines, colored only on terminals, or "json" lines for log collectors
+LOG_FORMAT = FROST_CONFIG.get("log_format", "text")
+if LOG_FORMAT not in ("text", "json"):
+    raise ValueError(f"Invalid log format {LOG_FORMAT}, expected one of ('text', 'json').")
 handler = logging.StreamHandler()
-handler.setFormatter(LFormatter(base_module.time.logical_elapsed, TIME_PRECISION))
+handler.setFormatter(FastLFormatter(base_module.time.logical_elapsed, TIME_PRECISION, colors=handler.stream.isatty(), json_lines=LOG_FORMAT == "json"))
 logger = logging.getLogger()
 logger.setLevel(LOGGING_LEVEL)
 # Add the handler only if it hasn't been added yet
-if not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):
+if not any(isinstance(getattr(h, "target", h), logging.StreamHandler) for h in logger.handlers):
+    # write the records from a background thread if async logging is enabled
+    if FROST_CONFIG.get("async_logging"):
+        from log_sink import create_log_handler
+        handler = create_log_handler(FROST_CONFIG["async_logging"], handler, base_module.time.logical_elapsed)
     logger.addHandler(handler)
 
+# setup instrumentation, None if disabled
+METRICS = None
+if FROST_CONFIG.get("instrumentation"):
+    from instrumentation import create_metrics_registry
+    METRICS = create_metrics_registry(FROST_CONFIG["instrumentation"])
+
 def is_target_valid(message: tuple[int, FrostMessage], target: str) -> bool:
     """Check if the target of the message matches the given target.
     Args:
@@ -0,0 +1,398 @@
+import struct
+from array import array
+from enum import Enum
+
+from machine_data_model.protocols.frost_v1.frost_message import FrostMessage
+from machine_data_model.protocols.frost_v1.frost_header import MsgType, MsgNamespace, ProtocolMsgName, FrostHeader, MethodMsgName, VariableMsgName
+from machine_data_model.protocols.frost_v1.frost_payload import VariablePayload, ProtocolPayload, MethodPayload, ErrorPayload, SubscriptionPayload, ErrorCode
+
+from batch_payload import BatchPayload
+
+MAGIC = b"FC"
+FORMAT_VERSION = 1
+
+# Value tags, in the spirit of msgpack.
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_SYMBOL = 6
+TAG_BYTES = 7
+TAG_LIST = 8
+TAG_TUPLE = 9
+TAG_DICT = 10
+TAG_ENUM = 11
+TAG_OBJECT = 12
+TAG_ARRAY = 13
+
+_FLOAT = struct.Struct("<d")
+# Type codes of the arrays that can be decoded as memoryview objects, i.e., all but the unicode ones.
+ARRAY_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+
+class FrostCodecError(ValueError):
+    """Raised when a message cannot be encoded or decoded."""
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, offset: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+def _read_bytes(data, offset: int, length: int):
+    end = offset + length
+    if end > len(data):
+        raise IndexError(f"{length} bytes expected at offset {offset}, {len(data) - offset} available")
+    return data[offset:end]
+
+
+class FrostCodec:
+    """Compact binary codec for FrostMessage objects.
+
+    Messages are encoded in batches. Each batch starts with a table of the symbols (i.e.,
+    the names of the senders and targets, the node paths and the payload field names) used
+    by its messages, which are then referenced by index. Header enums are encoded as small
+    integers and payloads as msgpack-style tagged values. Numerical ``array.array`` values
+    are stored as raw bytes and decoded without copies, as ``memoryview`` objects over the
+    input buffer cast to the original type code.
+
+    Payload classes and enums are identified by their position in the registries, so the
+    encoder and the decoder must register the same classes in the same order.
+
+    Args:
+        payload_types (Iterable[type] | None): Additional payload classes to register.
+        enum_types (Iterable[type[Enum]] | None): Additional enums to register.
+    """
+
+    def __init__(self, payload_types=None, enum_types=None) -> None:
+        self._msg_types = list(MsgType)
+        self._namespaces = list(MsgNamespace)
+        self._msg_names = {
+            MsgNamespace.PROTOCOL: list(ProtocolMsgName),
+            MsgNamespace.VARIABLE: list(VariableMsgName),
+            MsgNamespace.METHOD: list(MethodMsgName),
+        }
+        self._payload_types: list[type] = []
+        self._payload_indices: dict[type, int] = {}
+        self._enum_members: list[list] = []
+        self._enum_indices: dict[type, tuple[int, dict]] = {}
+        self._headers: dict[tuple, bytes] = {}
+
+        for payload_type in (VariablePayload, ProtocolPayload, MethodPayload, ErrorPayload, SubscriptionPayload, BatchPayload, *(payload_types or ())):
+            self.register_payload(payload_type)
+        for enum_type in (MsgType, MsgNamespace, ProtocolMsgName, VariableMsgName, MethodMsgName, ErrorCode, *(enum_types or ())):
+            self.register_enum(enum_type)
+
+    def register_payload(self, payload_type: type) -> None:
+        """Register a payload class, so that its instances can be encoded.
+
+        Args:
+            payload_type (type): The payload class. Instances are rebuilt without calling the constructor.
+        """
+        if payload_type not in self._payload_indices:
+            self._payload_indices[payload_type] = len(self._payload_types)
+            self._payload_types.append(payload_type)
+
+    def register_enum(self, enum_type: type) -> None:
+        """Register an enum, so that its members can be encoded.
+
+        Args:
+            enum_type (type[Enum]): The enum class.
+        """
+        if enum_type not in self._enum_indices:
+            members = list(enum_type)
+            self._enum_indices[enum_type] = (len(self._enum_members), {member: index for index, member in enumerate(members)})
+            self._enum_members.append(members)
+
+    def encode(self, message: FrostMessage) -> bytes:
+        """Encode a single message.
+
+        Args:
+            message (FrostMessage): The message to encode.
+        Returns:
+            bytes: The encoded message.
+        """
+        return self.encode_batch((message,))
+
+    def decode(self, data) -> FrostMessage:
+        """Decode a single message.
+
+        Args:
+            data (bytes-like): The encoded message.
+        Returns:
+            FrostMessage: The decoded message.
+        Raises:
+            FrostCodecError: If the data does not contain exactly one message.
+        """
+        messages = self.decode_batch(data)
+        if len(messages) != 1:
+            raise FrostCodecError(f"Expected one message, found {len(messages)}.")
+        return messages[0]
+
+    def encode_batch(self, messages) -> bytes:
+        """Encode a batch of messages sharing a single symbol table.
+
+        Args:
+            messages (Iterable[FrostMessage]): The messages to encode.
+        Returns:
+            bytes: The encoded batch.
+        """
+        symbols: dict[str, int] = {}
+        body = bytearray()
+        count = 0
+        for message in messages:
+            self._encode_message(message, body, symbols)
+            count += 1
+
+        out = bytearray(MAGIC)
+        out.append(FORMAT_VERSION)
+        _write_varint(out, len(symbols))
+        for symbol in symbols:
+            encoded = symbol.encode()
+            _write_varint(out, len(encoded))
+            out += encoded
+        _write_varint(out, count)
+        out += body
+        return bytes(out)
+
+    def decode_batch(self, data) -> list:
+        """Decode a batch of messages.
+
+        Args:
+            data (bytes-like): The encoded batch. Arrays in the payloads reference this buffer.
+        Returns:
+            list[FrostMessage]: The decoded messages.
+        Raises:
+            FrostCodecError: If the data is not a valid batch.
+        """
+        try:
+            data = memoryview(data)
+            if data.format != "B":
+                data = data.cast("B")
+            if len(data) < 3 or bytes(data[:2]) != MAGIC or data[2] != FORMAT_VERSION:
+                raise FrostCodecError("Invalid Frost codec header.")
+
+            symbol_count, offset = _read_varint(data, 3)
+            symbols = []
+            for _ in range(symbol_count):
+                length, offset = _read_varint(data, offset)
+                symbols.append(str(_read_bytes(data, offset, length), "utf-8"))
+                offset += length
+
+            count, offset = _read_varint(data, offset)
+            messages = []
+            for _ in range(count):
+                message, offset = self._decode_message(data, offset, symbols)
+                messages.append(message)
+            if offset != len(data):
+                raise FrostCodecError(f"Unexpected {len(data) - offset} trailing bytes.")
+        except FrostCodecError:
+            raise
+        except (IndexError, KeyError, TypeError, ValueError, UnicodeError, struct.error) as e:
+            raise FrostCodecError(f"Truncated or corrupted Frost codec data: {e}") from e
+        return messages
+
+    def _encode_header(self, header) -> bytes:
+        key = (header.type, header.namespace, header.msg_name, tuple(header.version))
+        encoded = self._headers.get(key)
+        if encoded is None:
+            try:
+                encoded = bytes((
+                    self._msg_types.index(header.type),
+                    self._namespaces.index(header.namespace),
+                    self._msg_names[header.namespace].index(header.msg_name),
+                    *header.version,
+                ))
+            except (ValueError, KeyError) as e:
+                raise FrostCodecError(f"Unsupported header {header}.") from e
+            self._headers[key] = encoded
+        return encoded
+
+    def _encode_message(self, message, buffer: bytearray, symbols: dict) -> None:
+        _write_varint(buffer, self._symbol(message.sender, symbols))
+        _write_varint(buffer, self._symbol(message.target, symbols))
+        self._encode_str(message.identifier, buffer)
+        if message.correlation_id == message.identifier:
+            buffer.append(TAG_NONE)
+        else:
+            self._encode_value(message.correlation_id, buffer, symbols)
+        buffer += self._encode_header(message.header)
+        self._encode_value(message.payload, buffer, symbols)
+
+    def _decode_message(self, data, offset: int, symbols: list) -> tuple:
+        sender, offset = _read_varint(data, offset)
+        target, offset = _read_varint(data, offset)
+        length, offset = _read_varint(data, offset)
+        identifier = str(_read_bytes(data, offset, length), "utf-8")
+        offset += length
+        correlation_id, offset = self._decode_value(data, offset, symbols)
+
+        namespace = self._namespaces[data[offset + 1]]
+        header = FrostHeader(
+            type=self._msg_types[data[offset]],
+            version=(data[offset + 3], data[offset + 4], data[offset + 5]),
+            namespace=namespace,
+            msg_name=self._msg_names[namespace][data[offset + 2]],
+        )
+        payload, offset = self._decode_value(data, offset + 6, symbols)
+
+        message = FrostMessage(
+            sender=symbols[sender],
+            target=symbols[target],
+            identifier=identifier,
+            header=header,
+            payload=payload,
+        )
+        message.correlation_id = identifier if correlation_id is None else correlation_id
+        return message, offset
+
+    @staticmethod
+    def _symbol(symbol: str, symbols: dict) -> int:
+        index = symbols.get(symbol)
+        if index is None:
+            index = symbols[symbol] = len(symbols)
+        return index
+
+    @staticmethod
+    def _encode_str(value: str, buffer: bytearray) -> None:
+        encoded = value.encode()
+        _write_varint(buffer, len(encoded))
+        buffer += encoded
+
+    def _encode_value(self, value, buffer: bytearray, symbols: dict) -> None:
+        value_type = type(value)
+        if value is None:
+            buffer.append(TAG_NONE)
+        elif value_type is bool:
+            buffer.append(TAG_TRUE if value else TAG_FALSE)
+        elif value_type is int:
+            buffer.append(TAG_INT)
+            # Zigzag encoding keeps small negative numbers small.
+            _write_varint(buffer, (value << 1) if value >= 0 else ((-value << 1) - 1))
+        elif value_type is float:
+            buffer.append(TAG_FLOAT)
+            buffer += _FLOAT.pack(value)
+        elif value_type is str:
+            buffer.append(TAG_STR)
+            self._encode_str(value, buffer)
+        elif value_type is list or value_type is tuple:
+            buffer.append(TAG_LIST if value_type is list else TAG_TUPLE)
+            _write_varint(buffer, len(value))
+            for item in value:
+                self._encode_value(item, buffer, symbols)
+        elif value_type is dict:
+            buffer.append(TAG_DICT)
+            _write_varint(buffer, len(value))
+            for key, item in value.items():
+                self._encode_value(key, buffer, symbols)
+                self._encode_value(item, buffer, symbols)
+        elif value_type is array:
+            if value.typecode not in ARRAY_TYPECODES:
+                raise FrostCodecError(f"Cannot encode array of type code {value.typecode!r}, expected one of {''.join(sorted(ARRAY_TYPECODES))}.")
+            buffer.append(TAG_ARRAY)
+            buffer.append(ord(value.typecode))
+            raw = memoryview(value).cast("B")
+            _write_varint(buffer, len(raw))
+            buffer += raw
+        elif value_type is bytes or value_type is bytearray or value_type is memoryview:
+            buffer.append(TAG_BYTES)
+            raw = memoryview(value).cast("B")
+            _write_varint(buffer, len(raw))
+            buffer += raw
+        elif isinstance(value, Enum) and value_type in self._enum_indices:
+            enum_index, member_indices = self._enum_indices[value_type]
+            buffer.append(TAG_ENUM)
+            _write_varint(buffer, enum_index)
+            _write_varint(buffer, member_indices[value])
+        elif value_type in self._payload_indices:
+            fields = vars(value)
+            buffer.append(TAG_OBJECT)
+            _write_varint(buffer, self._payload_indices[value_type])
+            _write_varint(buffer, len(fields))
+            for name, item in fields.items():
+                _write_varint(buffer, self._symbol(name, symbols))
+                # Node paths are repeated across messages, hence they are stored in the symbol table.
+                if name == "node" and type(item) is str:
+                    buffer.append(TAG_SYMBOL)
+                    _write_varint(buffer, self._symbol(item, symbols))
+                else:
+                    self._encode_value(item, buffer, symbols)
+        else:
+            raise FrostCodecError(f"Cannot encode value of type {value_type.__name__}.")
+
+    def _decode_value(self, data, offset: int, symbols: list) -> tuple:
+        tag = data[offset]
+        offset += 1
+        if tag == TAG_NONE:
+            return None, offset
+        if tag == TAG_FALSE:
+            return False, offset
+        if tag == TAG_TRUE:
+            return True, offset
+        if tag == TAG_INT:
+            value, offset = _read_varint(data, offset)
+            return (value >> 1) if not value & 1 else -((value + 1) >> 1), offset
+        if tag == TAG_FLOAT:
+            return _FLOAT.unpack_from(data, offset)[0], offset + 8
+        if tag == TAG_STR:
+            length, offset = _read_varint(data, offset)
+            return str(_read_bytes(data, offset, length), "utf-8"), offset + length
+        if tag == TAG_SYMBOL:
+            index, offset = _read_varint(data, offset)
+            return symbols[index], offset
+        if tag == TAG_LIST or tag == TAG_TUPLE:
+            length, offset = _read_varint(data, offset)
+            items = []
+            for _ in range(length):
+                item, offset = self._decode_value(data, offset, symbols)
+                items.append(item)
+            return (items if tag == TAG_LIST else tuple(items)), offset
+        if tag == TAG_DICT:
+            length, offset = _read_varint(data, offset)
+            items = {}
+            for _ in range(length):
+                key, offset = self._decode_value(data, offset, symbols)
+                items[key], offset = self._decode_value(data, offset, symbols)
+            return items, offset
+        if tag == TAG_ARRAY:
+            typecode = chr(data[offset])
+            if typecode not in ARRAY_TYPECODES:
+                raise FrostCodecError(f"Invalid array type code {typecode!r}.")
+            length, offset = _read_varint(data, offset + 1)
+            if length % struct.calcsize(typecode):
+                raise FrostCodecError(f"Invalid length {length} of an array of type code {typecode!r}.")
+            return _read_bytes(data, offset, length).cast(typecode), offset + length
+        if tag == TAG_BYTES:
+            length, offset = _read_varint(data, offset)
+            return bytes(_read_bytes(data, offset, length)), offset + length
+        if tag == TAG_ENUM:
+            enum_index, offset = _read_varint(data, offset)
+            member_index, offset = _read_varint(data, offset)
+            return self._enum_members[enum_index][member_index], offset
+        if tag == TAG_OBJECT:
+            payload_index, offset = _read_varint(data, offset)
+            payload_type = self._payload_types[payload_index]
+            length, offset = _read_varint(data, offset)
+            payload = payload_type.__new__(payload_type)
+            for _ in range(length):
+                name, offset = _read_varint(data, offset)
+                value, offset = self._decode_value(data, offset, symbols)
+                object.__setattr__(payload, symbols[name], value)
+            return payload, offset
+        raise FrostCodecError(f"Unknown value tag {tag}.")
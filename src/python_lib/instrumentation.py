@@ -0,0 +1,234 @@
+import atexit
+import csv
+import json
+import os
+import threading
+import time
+
+
+class Histogram:
+    """Histogram of non-negative durations in nanoseconds with power-of-two buckets.
+
+    Attributes:
+        count (int): The number of observations.
+        total (int): The sum of the observations.
+        max (int): The largest observation.
+        buckets (dict[int, int]): The number of observations per bucket, indexed by the bit length of the observation.
+    """
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets: dict[int, int] = {}
+
+    def observe(self, value: int, count: int = 1) -> None:
+        if value < 0:
+            value = 0
+        self.count += count
+        self.total += value * count
+        if value > self.max:
+            self.max = value
+        bucket = value.bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+
+    def snapshot(self) -> dict:
+        """Returns a serializable copy of the histogram. Buckets are labelled with their upper bound in nanoseconds."""
+        buckets = self.buckets.copy()
+        return {
+            "count": self.count,
+            "total_ns": self.total,
+            "max_ns": self.max,
+            "buckets": {str((1 << bucket) - 1): buckets[bucket] for bucket in sorted(buckets)},
+        }
+
+
+class ReactorMetrics:
+    """Counters and reaction timings of a single reactor.
+
+    Args:
+        name (str): The name of the reactor.
+
+    Attributes:
+        name (str): The name of the reactor.
+        clock (Callable[[], int]): The clock used to time the reactions, in nanoseconds.
+        counters (dict[str, int]): The counters of the reactor (e.g., messages per port).
+        reactions (dict[str, Histogram]): The wall-time histogram of each instrumented reaction.
+        histograms (dict[str, Histogram]): Other durations observed by the reactor (e.g., the routing delay of the messages).
+        lag (Histogram): The lag of physical time behind logical time observed at the end of the reactions.
+    """
+
+    __slots__ = ("name", "clock", "counters", "reactions", "histograms", "lag")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.clock = time.perf_counter_ns
+        self.counters: dict[str, int] = {}
+        self.reactions: dict[str, Histogram] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self.lag = Histogram()
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        """Increment a counter of the reactor.
+
+        Args:
+            counter (str): The name of the counter.
+            value (int): The increment.
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def observe_reaction(self, reaction: str, start: int, lag: int) -> None:
+        """Record the execution of a reaction.
+
+        Args:
+            reaction (str): The name of the reaction.
+            start (int): The value of ``clock`` when the reaction started.
+            lag (int): The difference between physical and logical elapsed time, in nanoseconds.
+        """
+        duration = self.clock() - start
+        histogram = self.reactions.get(reaction)
+        if histogram is None:
+            histogram = self.reactions[reaction] = Histogram()
+        histogram.observe(duration)
+        self.lag.observe(lag)
+
+    def observe(self, name: str, value: int, count: int = 1) -> None:
+        """Record a duration in a histogram of the reactor.
+
+        Args:
+            name (str): The name of the histogram.
+            value (int): The duration, in nanoseconds.
+            count (int): The number of observations of the duration, e.g., one per message.
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(value, count)
+
+    def snapshot(self) -> dict:
+        """Returns a serializable copy of the metrics."""
+        reactions = self.reactions.copy()
+        histograms = self.histograms.copy()
+        return {
+            "counters": self.counters.copy(),
+            "reactions": {name: histogram.snapshot() for name, histogram in reactions.items()},
+            "histograms": {name: histogram.snapshot() for name, histogram in histograms.items()},
+            "lag": self.lag.snapshot(),
+        }
+
+
+class MetricsRegistry:
+    """Registry of the metrics of all the reactors of a Frost program.
+
+    Snapshots are written to a JSON or CSV file every ``interval`` seconds of physical time
+    by a background thread, and once more when the program exits.
+
+    Args:
+        path (str): The path of the snapshot file.
+        format (str): The format of the snapshot file, either ``json`` or ``csv``.
+        interval (float | None): The export period in seconds, None to export only at exit.
+    """
+
+    FORMATS = ("json", "csv")
+
+    def __init__(self, path: str, format: str = "json", interval: float | None = None) -> None:
+        if format not in self.FORMATS:
+            raise ValueError(f"Invalid metrics format {format}, expected one of {self.FORMATS}.")
+
+        self.path = path
+        self.format = format
+        self.interval = interval
+        self._reactors: dict[str, ReactorMetrics] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def reactor(self, name: str) -> ReactorMetrics:
+        """Returns the metrics of the given reactor, creating them if needed.
+
+        Args:
+            name (str): The name of the reactor.
+        Returns:
+            ReactorMetrics: The metrics of the reactor.
+        """
+        metrics = self._reactors.get(name)
+        if metrics is None:
+            metrics = self._reactors[name] = ReactorMetrics(name)
+        return metrics
+
+    def snapshot(self) -> dict:
+        """Returns a serializable copy of the metrics of all the reactors."""
+        reactors = self._reactors.copy()
+        return {
+            "timestamp": time.time(),
+            "reactors": {name: metrics.snapshot() for name, metrics in reactors.items()},
+        }
+
+    def export(self) -> None:
+        """Write a snapshot of the metrics to the snapshot file, replacing the previous one."""
+        snapshot = self.snapshot()
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", newline="") as snapshot_file:
+                if self.format == "json":
+                    json.dump(snapshot, snapshot_file, indent=2)
+                else:
+                    self._write_csv(snapshot, snapshot_file)
+            os.replace(tmp_path, self.path)
+
+    def start(self) -> None:
+        """Start the periodic export and register the final export at exit."""
+        atexit.register(self.stop)
+        if self.interval and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="frost-metrics", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the periodic export and write the final snapshot."""
+        self._stop.set()
+        self.export()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.export()
+
+    @staticmethod
+    def _write_csv(snapshot: dict, snapshot_file) -> None:
+        writer = csv.writer(snapshot_file)
+        writer.writerow(["timestamp", "reactor", "kind", "name", "count", "total_ns", "max_ns"])
+        timestamp = snapshot["timestamp"]
+        for reactor, metrics in snapshot["reactors"].items():
+            for name, value in metrics["counters"].items():
+                writer.writerow([timestamp, reactor, "counter", name, value, "", ""])
+            for name, histogram in metrics["reactions"].items():
+                writer.writerow([timestamp, reactor, "reaction", name, histogram["count"], histogram["total_ns"], histogram["max_ns"]])
+            for name, histogram in metrics["histograms"].items():
+                writer.writerow([timestamp, reactor, "histogram", name, histogram["count"], histogram["total_ns"], histogram["max_ns"]])
+            lag = metrics["lag"]
+            writer.writerow([timestamp, reactor, "lag", "", lag["count"], lag["total_ns"], lag["max_ns"]])
+
+
+def create_metrics_registry(configuration: dict | None) -> MetricsRegistry | None:
+    """Create and start the metrics registry described by the ``instrumentation`` section of the configuration.
+
+    Args:
+        configuration (dict | None): The ``instrumentation`` section of the configuration. A ``{pid}`` placeholder in the path is replaced with the process id, so that the federates of a federated program write distinct files.
+    Returns:
+        MetricsRegistry | None: The started registry, None if the instrumentation is disabled.
+    """
+    if not configuration or not configuration.get("enabled", False):
+        return None
+
+    registry = MetricsRegistry(
+        path=configuration.get("path", "frost_metrics.json").format(pid=os.getpid()),
+        format=configuration.get("format", "json"),
+        interval=configuration.get("interval"),
+    )
+    registry.start()
+    return registry
@@ -0,0 +1,162 @@
+import copy
+import logging
+import threading
+from collections import deque
+
+
+class AsyncLogHandler(logging.Handler):
+    """Handler moving the output of the log records out of the reactions.
+
+    The records are captured in the calling thread: the message is rendered and the elapsed
+    logical time is stored in the ``lf_logical_time`` attribute of a copy of the record, which
+    is used by the FastLFormatter instead of the time at which the record is written. The
+    record passed to the handler is left unchanged for the other handlers. A background
+    thread then formats the records and writes them to the target handler in batches.
+
+    The buffer holds at most ``capacity`` records. When it is full, new records are dropped
+    and counted, and the number of dropped records is reported in the output once the
+    buffer drains. The pending records are written when the handler is closed, e.g., by
+    ``logging.shutdown`` at exit.
+
+    Args:
+        target (logging.Handler): The handler writing the records.
+        lf_logical_elapsed (callable): The function returning the elapsed logical time in nanoseconds.
+        capacity (int): The maximum number of pending records.
+        batch_size (int): The maximum number of records written at once.
+        interval (float): The maximum time a record waits before being written, in seconds.
+
+    Attributes:
+        target (logging.Handler): The handler writing the records.
+        dropped (int): The number of records dropped because the buffer was full.
+    """
+
+    def __init__(self, target: logging.Handler, lf_logical_elapsed, capacity: int = 10000, batch_size: int = 256, interval: float = 0.1) -> None:
+        if capacity < 1 or batch_size < 1:
+            raise ValueError(f"Invalid async logging capacity {capacity} or batch size {batch_size}, expected positive values.")
+
+        super().__init__()
+        self.target = target
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self._lf_logical_elapsed = lf_logical_elapsed
+        self._records = deque()
+        self._reported_drops = 0
+        self._condition = threading.Condition()
+        # Held while writing, so that the reactions never wait for the output.
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="frost-log-sink", daemon=True)
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        records = self._records
+        if len(records) >= self.capacity:
+            self.dropped += 1
+            return
+
+        try:
+            record = copy.copy(record)
+            record.lf_logical_time = self._lf_logical_elapsed()
+            # Render the message now, as the arguments may change before the record is written.
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+                record.exc_info = None
+        except Exception:
+            self.handleError(record)
+            return
+
+        records.append(record)
+        if len(records) >= self.batch_size:
+            with self._condition:
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """Write the pending records."""
+        with self._write_lock:
+            self._write_pending()
+
+    def close(self) -> None:
+        """Stop the background thread and write the pending records."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+        self.target.flush()
+        super().close()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed and len(self._records) < self.batch_size:
+                    self._condition.wait(self.interval)
+                closed = self._closed
+            with self._write_lock:
+                self._write_pending()
+            if closed:
+                return
+
+    def _write_pending(self) -> None:
+        """Write the pending records in batches. Must be called holding the write lock."""
+        records = self._records
+        while records:
+            batch = [records.popleft() for _ in range(min(self.batch_size, len(records)))]
+            self._write_batch(batch)
+
+        if self.dropped != self._reported_drops:
+            record = logging.LogRecord("frost.log_sink", logging.WARNING, __file__, 0, "%s log records dropped because the buffer was full.", (self.dropped - self._reported_drops,), None)
+            record.lf_logical_time = self._lf_logical_elapsed()
+            self._reported_drops = self.dropped
+            self._write_batch([record])
+
+    def _write_batch(self, batch: list) -> None:
+        target = self.target
+        if not isinstance(target, logging.StreamHandler):
+            for record in batch:
+                target.handle(record)
+            return
+
+        lines = []
+        for record in batch:
+            if record.levelno < target.level:
+                continue
+            try:
+                lines.append(target.format(record) + target.terminator)
+            except Exception:
+                target.handleError(record)
+        if not lines:
+            return
+
+        with target.lock:
+            try:
+                target.stream.write("".join(lines))
+                target.flush()
+            except Exception:
+                target.handleError(batch[-1])
+
+
+def create_log_handler(configuration: dict | None, target: logging.Handler, lf_logical_elapsed) -> logging.Handler:
+    """Create the handler described by the ``async_logging`` section of the configuration.
+
+    Args:
+        configuration (dict | None): The ``async_logging`` section of the configuration.
+        target (logging.Handler): The handler writing the records.
+        lf_logical_elapsed (callable): The function returning the elapsed logical time in nanoseconds.
+    Returns:
+        logging.Handler: An AsyncLogHandler wrapping the target, or the target itself if asynchronous logging is disabled.
+    """
+    if not configuration or not configuration.get("enabled", False):
+        return target
+
+    return AsyncLogHandler(
+        target,
+        lf_logical_elapsed,
+        capacity=configuration.get("capacity", 10000),
+        batch_size=configuration.get("batch_size", 256),
+        interval=configuration.get("interval", 0.1),
+    )
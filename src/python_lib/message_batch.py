@@ -0,0 +1,55 @@
+class MessageBatch:
+    """View over the messages received on the channels of a port in a tag.
+
+    The batch keeps a reference to the list received on each channel together with its
+    bank index, so that messages can be handed over between reactors without flattening
+    them into new lists. Iterating over the batch yields (bank index, message) tuples.
+
+    Args:
+        segments (list[tuple[int | None, list]]): The bank index and the list of messages received on each channel.
+
+    Attributes:
+        segments (list[tuple[int | None, list]]): The bank index and the list of messages received on each channel.
+    """
+
+    __slots__ = ("segments",)
+
+    def __init__(self, segments: list) -> None:
+        self.segments = segments
+
+    @classmethod
+    def from_port(cls, input_port) -> "MessageBatch":
+        """Build the batch of the messages present on a port.
+
+        Args:
+            input_port (input): The port or multiport to read. The bank index is None for single ports.
+        Returns:
+            MessageBatch: The batch referencing the lists present on the port.
+        """
+        if input_port.width <= 0:
+            return cls([(None, input_port.value)] if input_port.is_present else [])
+
+        return cls([(bank_index, port.value) for bank_index, port in enumerate(input_port) if port.is_present])
+
+    def __iter__(self):
+        for bank_index, messages in self.segments:
+            for message in messages:
+                yield bank_index, message
+
+    def __len__(self) -> int:
+        return sum(len(messages) for _, messages in self.segments)
+
+    def __bool__(self) -> bool:
+        return any(messages for _, messages in self.segments)
+
+    def __repr__(self) -> str:
+        return f"MessageBatch({self.segments!r})"
+
+    def messages(self):
+        """Iterate over the messages of the batch, without their bank index.
+
+        Yields:
+            FrostMessage: The messages of the batch, in bank order.
+        """
+        for _, messages in self.segments:
+            yield from messages
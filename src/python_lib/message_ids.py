@@ -0,0 +1,24 @@
+from itertools import count
+
+
+class MessageIdGenerator:
+    """Generator of monotonically increasing message identifiers for a reactor.
+
+    Identifiers are built from the reactor name and an integer counter, which is much
+    cheaper than generating random UUIDs and keeps identifiers unique across the plant
+    as long as reactor names are unique. The name is needed because the responses are
+    correlated to the requests of all the senders by identifier, which the FrostMessage
+    carries as a string.
+
+    Args:
+        prefix (str): The prefix of the identifiers, usually the name of the reactor.
+    """
+
+    __slots__ = ("prefix", "_counter")
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self._counter = count(1)
+
+    def __call__(self) -> str:
+        return f"{self.prefix}:{next(self._counter)}"
@@ -0,0 +1,143 @@
+import mmap
+import os
+import struct
+
+from frost_codec import FrostCodec
+
+TRACE_MAGIC = b"FTRC"
+TRACE_VERSION = 1
+INBOUND = 0
+OUTBOUND = 1
+
+# length, direction, logical time, microstep, bank index (-1 for single ports)
+_RECORD_HEADER = struct.Struct("<IBqIi")
+_FILE_HEADER = struct.Struct("<4sB")
+
+
+class TraceWriter:
+    """Append-only, memory-mapped trace of the messages exchanged on the channels of a reactor.
+
+    Each record stores the tag, the direction and the bank index of a batch of messages,
+    encoded with the FrostCodec. The file grows in chunks of ``chunk_size`` bytes and is
+    truncated to its actual size when the writer is closed.
+
+    Args:
+        path (str): The path of the trace file. An existing file is overwritten.
+        codec (FrostCodec | None): The codec used to encode the messages.
+        chunk_size (int): The size of the chunks the file grows by, in bytes.
+    """
+
+    def __init__(self, path: str, codec: FrostCodec | None = None, chunk_size: int = 1 << 20) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.codec = codec or FrostCodec()
+        self.chunk_size = chunk_size
+        self.records = 0
+        self._file = open(path, "w+b")
+        self._capacity = 0
+        self._mmap = None
+        self._size = 0
+        self._reserve(_FILE_HEADER.size)
+        _FILE_HEADER.pack_into(self._mmap, 0, TRACE_MAGIC, TRACE_VERSION)
+        self._size = _FILE_HEADER.size
+
+    def write(self, direction: int, logical_time: int, microstep: int, bank_index: int | None, messages) -> None:
+        """Append a record to the trace.
+
+        Args:
+            direction (int): INBOUND or OUTBOUND.
+            logical_time (int): The elapsed logical time of the tag, in nanoseconds.
+            microstep (int): The microstep of the tag.
+            bank_index (int | None): The bank index of the channel, None for single ports.
+            messages (Iterable[FrostMessage]): The messages exchanged on the channel.
+        """
+        data = self.codec.encode_batch(messages)
+        size = _RECORD_HEADER.size + len(data)
+        self._reserve(size)
+
+        offset = self._size
+        _RECORD_HEADER.pack_into(self._mmap, offset, len(data), direction, logical_time, microstep, -1 if bank_index is None else bank_index)
+        offset += _RECORD_HEADER.size
+        self._mmap[offset:offset + len(data)] = data
+        self._size = offset + len(data)
+        self.records += 1
+
+    def flush(self) -> None:
+        """Flush the written records to the file."""
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """Flush the records and truncate the file to its actual size."""
+        if self._file.closed:
+            return
+
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(self._size)
+        self._file.close()
+
+    def _reserve(self, size: int) -> None:
+        required = self._size + size
+        if required <= self._capacity:
+            return
+
+        capacity = max(self._capacity, self.chunk_size)
+        while capacity < required:
+            capacity *= 2
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.truncate(capacity)
+        self._mmap = mmap.mmap(self._file.fileno(), capacity)
+        self._capacity = capacity
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class TraceReader:
+    """Reader of the records of a trace file written by a TraceWriter.
+
+    Iterating over the reader yields ``(logical_time, microstep, direction, bank_index, messages)``
+    tuples in recording order. The file is memory-mapped and decoded lazily.
+
+    Args:
+        path (str): The path of the trace file.
+        codec (FrostCodec | None): The codec used to decode the messages.
+    Raises:
+        ValueError: If the file is not a trace file.
+    """
+
+    def __init__(self, path: str, codec: FrostCodec | None = None) -> None:
+        self.path = path
+        self.codec = codec or FrostCodec()
+        with open(path, "rb") as trace_file:
+            self._mmap = mmap.mmap(trace_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _FILE_HEADER.size or _FILE_HEADER.unpack_from(self._mmap, 0) != (TRACE_MAGIC, TRACE_VERSION):
+            raise ValueError(f"{path} is not a Frost trace file.")
+
+    def __iter__(self):
+        buffer = self._mmap
+        offset = _FILE_HEADER.size
+        end = len(buffer)
+        while offset + _RECORD_HEADER.size <= end:
+            length, direction, logical_time, microstep, bank_index = _RECORD_HEADER.unpack_from(buffer, offset)
+            # A zero length marks the unused tail of a trace that was not closed.
+            if length == 0:
+                return
+
+            offset += _RECORD_HEADER.size
+            messages = self.codec.decode_batch(buffer[offset:offset + length])
+            offset += length
+            yield logical_time, microstep, direction, None if bank_index < 0 else bank_index, messages
+
+    def close(self) -> None:
+        """Close the memory map of the trace."""
+        self._mmap.close()
@@ -0,0 +1,91 @@
+import heapq
+from collections.abc import Callable
+from itertools import count
+
+
+class MethodQueue:
+    """Bounded priority queue of method invocation requests.
+
+    Requests with a higher priority are executed first, requests with the same priority
+    are executed in arrival order. When the queue is full, the overflow policy decides
+    which request is refused: the incoming one (``reject``) or the oldest request with
+    the lowest priority (``drop_oldest``).
+
+    Args:
+        capacity (int): The maximum number of pending requests.
+        overflow (str): The overflow policy, either ``reject`` or ``drop_oldest``.
+        priorities (dict[str, int] | None): The priority of each method, indexed by node path. Methods not listed have priority 0.
+        key (Callable | None): The function mapping the node paths of the priorities and the nodes of the requests,
+            which can be paths in another form or handles, to the same key. None to use the nodes verbatim.
+
+    Attributes:
+        capacity (int): The maximum number of pending requests.
+        overflow (str): The overflow policy.
+        priorities (dict): The priority of each method, indexed by the key of its node.
+        key (Callable | None): The function mapping the nodes to the keys of the priorities.
+        refused (int): The number of requests refused because the queue was full.
+    """
+
+    REJECT = "reject"
+    DROP_OLDEST = "drop_oldest"
+
+    def __init__(self, capacity: int = 1024, overflow: str = REJECT, priorities: dict | None = None, key: Callable | None = None) -> None:
+        if capacity <= 0:
+            raise ValueError(f"Invalid method queue capacity {capacity}.")
+        if overflow not in (self.REJECT, self.DROP_OLDEST):
+            raise ValueError(f"Invalid method queue overflow policy {overflow}.")
+
+        self.capacity = capacity
+        self.overflow = overflow
+        self.key = key
+        priorities = priorities or {}
+        self.priorities = {key(node): priority for node, priority in priorities.items()} if key is not None else dict(priorities)
+        self.refused = 0
+        self._heap: list[tuple[int, int, object]] = []
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def push(self, message):
+        """Add a method invocation request to the queue.
+
+        Args:
+            message (FrostMessage): The method invocation request.
+        Returns:
+            FrostMessage | None: The request refused because the queue was full, None if no request was refused.
+        """
+        node = message.payload.node if self.key is None else self.key(message.payload.node)
+        entry = (-self.priorities.get(node, 0), next(self._sequence), message)
+        heap = self._heap
+        if len(heap) < self.capacity:
+            heapq.heappush(heap, entry)
+            return None
+
+        self.refused += 1
+        if self.overflow == self.REJECT:
+            return message
+
+        # The oldest request with the lowest priority is the one with the highest negated priority and the lowest sequence number.
+        victim = max(heap, key=lambda e: (e[0], -e[1]))
+        if entry[0] > victim[0]:
+            return message
+
+        heap.remove(victim)
+        heapq.heapify(heap)
+        heapq.heappush(heap, entry)
+        return victim[2]
+
+    def pop_batch(self, size: int) -> list:
+        """Remove the requests with the highest priority from the queue.
+
+        Args:
+            size (int): The maximum number of requests to remove.
+        Returns:
+            list[FrostMessage]: The removed requests, in execution order.
+        """
+        heap = self._heap
+        return [heapq.heappop(heap)[2] for _ in range(min(size, len(heap)))]
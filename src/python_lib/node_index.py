@@ -0,0 +1,152 @@
+from machine_data_model.nodes.folder_node import FolderNode
+
+from data_model_utils import iter_nodes
+
+
+class NodeIndex:
+    """Index of the nodes of a data model by path and by integer handle.
+
+    The index is built once from the data model tree and replaces the ``get_node`` method of
+    the data model instance, so that every lookup (including the ones performed by the
+    protocol manager) is a dictionary access instead of a walk of the tree. Nodes added with
+    ``FolderNode.add_child`` are indexed incrementally, while removals invalidate the index,
+    which is rebuilt on the next lookup. Paths that are not in the index are resolved by
+    the original ``get_node`` method.
+
+    Each indexed node also gets an integer handle, which can be used instead of the path in
+    the messages exchanged between reactors sharing the data model. Handles are stable as
+    long as the node is not removed.
+
+    Args:
+        data_model (DataModel): The data model to index.
+
+    Attributes:
+        hits (int): The number of lookups resolved by the index.
+        misses (int): The number of lookups resolved by the original ``get_node`` method.
+    """
+
+    def __init__(self, data_model) -> None:
+        self.data_model = data_model
+        self.hits = 0
+        self.misses = 0
+        self._get_node = data_model.get_node
+        self._nodes: dict[str, object] = {}
+        self._handles: dict[str, int] = {}
+        self._handle_nodes: list = []
+        self._folder_paths: dict[int, str] = {}
+        self._valid = False
+        self.rebuild()
+
+    def install(self) -> "NodeIndex":
+        """Replace the ``get_node`` method of the data model with the indexed lookup.
+
+        Returns:
+            NodeIndex: The index itself.
+        """
+        self.data_model.get_node = self.get_node
+        return self
+
+    def rebuild(self) -> None:
+        """Rebuild the index from the data model tree. Handles of the nodes still in the tree are preserved."""
+        self._nodes.clear()
+        self._folder_paths.clear()
+        self._index(self.data_model.root, "")
+
+        handles = {path: handle for path, handle in self._handles.items() if path in self._nodes}
+        self._handle_nodes = [None] * (max(handles.values(), default=-1) + 1)
+        for path, handle in handles.items():
+            self._handle_nodes[handle] = self._nodes[path]
+        self._handles = handles
+        self._valid = True
+
+    def invalidate(self) -> None:
+        """Mark the index as outdated. It is rebuilt on the next lookup."""
+        self._valid = False
+
+    def get_node(self, path):
+        """Returns the node with the given path or handle.
+
+        Args:
+            path (str | int): The path of the node, with or without the leading slash, or its handle.
+        Returns:
+            DataModelNode | None: The node, None if not found.
+        """
+        if not self._valid:
+            self.rebuild()
+
+        if type(path) is int:
+            # Negative handles are invalid, not indices from the end.
+            node = self._handle_nodes[path] if 0 <= path < len(self._handle_nodes) else None
+            if node is not None:
+                self.hits += 1
+            return node
+
+        node = self._nodes.get(path)
+        if node is None and path.startswith("/"):
+            node = self._nodes.get(path.lstrip("/"))
+        if node is not None:
+            self.hits += 1
+            return node
+
+        self.misses += 1
+        return self._get_node(path)
+
+    def handle(self, path: str) -> int:
+        """Returns the integer handle of a node, assigning it if needed.
+
+        Args:
+            path (str): The path of the node.
+        Returns:
+            int: The handle of the node.
+        Raises:
+            KeyError: If the path is not in the index.
+        """
+        if not self._valid:
+            self.rebuild()
+
+        path = path.lstrip("/")
+        handle = self._handles.get(path)
+        if handle is None:
+            node = self._nodes[path]
+            handle = self._handles[path] = len(self._handle_nodes)
+            self._handle_nodes.append(node)
+        return handle
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _index(self, node, parent_path: str) -> None:
+        prefix = f"{parent_path}/" if parent_path else ""
+        for path, child in iter_nodes(node):
+            path = prefix + path
+            self._nodes[path] = child
+            if isinstance(child, FolderNode):
+                self._folder_paths[id(child)] = path
+                self._watch(child)
+
+    def _watch(self, folder) -> None:
+        """Wrap the methods changing the children of a folder to keep the index up to date."""
+        if getattr(folder, "_node_index", None) is self:
+            return
+
+        folder._node_index = self
+        add_child = folder.add_child
+
+        def indexed_add_child(child, *args, **kwargs):
+            result = add_child(child, *args, **kwargs)
+            folder_path = self._folder_paths.get(id(folder))
+            if self._valid and folder_path is not None:
+                self._index(child, folder_path)
+            else:
+                self._valid = False
+            return result
+
+        folder.add_child = indexed_add_child
+
+        remove_child = getattr(folder, "remove_child", None)
+        if remove_child is not None:
+            def indexed_remove_child(*args, **kwargs):
+                self._valid = False
+                return remove_child(*args, **kwargs)
+
+            folder.remove_child = indexed_remove_child
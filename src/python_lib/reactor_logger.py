@@ -0,0 +1,104 @@
+import logging
+from l_formatter import get_logger_instance
+
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+
+class ReactorLogger:
+    """Logging facade for Frost reactors that caches the effective level of the underlying logger.
+
+    Disabled calls cost a single attribute check: the message is never formatted and the
+    arguments are never converted to strings. The records report the file, line and function
+    of the caller of the facade. Messages must use the lazy %-style formatting
+    (e.g., ``logger.debug("Processing message: %s", message)``) to benefit from it.
+    The cache is updated by ``setLevel``; call ``refresh`` if the level of the underlying
+    logger (or of one of its parents) is changed directly.
+
+    Args:
+        logger (logging.Logger): The logger to wrap.
+
+    Attributes:
+        logger (logging.Logger): The wrapped logger.
+        trace_enabled (bool): True if TRACE messages are emitted.
+        debug_enabled (bool): True if DEBUG messages are emitted.
+        info_enabled (bool): True if INFO messages are emitted.
+        warning_enabled (bool): True if WARNING messages are emitted.
+    """
+
+    __slots__ = ("logger", "trace_enabled", "debug_enabled", "info_enabled", "warning_enabled")
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self.refresh()
+
+    @property
+    def name(self) -> str:
+        return self.logger.name
+
+    @property
+    def level(self) -> int:
+        return self.logger.level
+
+    def refresh(self) -> None:
+        """Update the cached effective level of the logger."""
+        level = self.logger.getEffectiveLevel()
+        self.trace_enabled = level <= TRACE
+        self.debug_enabled = level <= logging.DEBUG
+        self.info_enabled = level <= logging.INFO
+        self.warning_enabled = level <= logging.WARNING
+
+    def setLevel(self, level) -> None:
+        """Set the level of the logger and update the cached effective level.
+
+        Args:
+            level (int | str): The new logging level.
+        """
+        self.logger.setLevel(level)
+        self.refresh()
+
+    def getEffectiveLevel(self) -> int:
+        return self.logger.getEffectiveLevel()
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def trace(self, msg, *args, **kwargs) -> None:
+        if self.trace_enabled:
+            self.logger.log(TRACE, msg, *args, stacklevel=2, **kwargs)
+
+    def debug(self, msg, *args, **kwargs) -> None:
+        if self.debug_enabled:
+            self.logger.debug(msg, *args, stacklevel=2, **kwargs)
+
+    def info(self, msg, *args, **kwargs) -> None:
+        if self.info_enabled:
+            self.logger.info(msg, *args, stacklevel=2, **kwargs)
+
+    def warning(self, msg, *args, **kwargs) -> None:
+        if self.warning_enabled:
+            self.logger.warning(msg, *args, stacklevel=2, **kwargs)
+
+    def error(self, msg, *args, **kwargs) -> None:
+        self.logger.error(msg, *args, stacklevel=2, **kwargs)
+
+    def exception(self, msg, *args, **kwargs) -> None:
+        self.logger.exception(msg, *args, stacklevel=2, **kwargs)
+
+    def critical(self, msg, *args, **kwargs) -> None:
+        self.logger.critical(msg, *args, stacklevel=2, **kwargs)
+
+    def log(self, level: int, msg, *args, **kwargs) -> None:
+        self.logger.log(level, msg, *args, stacklevel=2, **kwargs)
+
+
+def get_reactor_logger(reactor_name: str, parent_reactor: str = "") -> ReactorLogger:
+    """Get the logging facade for the given reactor.
+
+    Args:
+        reactor_name (str): The name of the reactor.
+        parent_reactor (str): The name of the parent reactor, if any.
+    Returns:
+        ReactorLogger: The logging facade wrapping the reactor logger.
+    """
+    return ReactorLogger(get_logger_instance(parent_reactor, reactor_name))
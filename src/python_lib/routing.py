@@ -0,0 +1,217 @@
+from collections import deque
+
+from machine_data_model.protocols.frost_v1.frost_header import VariableMsgName
+
+TOPIC_PREFIX = "topic:"
+
+
+def topic_name(publisher: str, node: str) -> str:
+    """Returns the name of the topic of the updates of a variable.
+
+    Args:
+        publisher (str): The name of the Frost component owning the variable.
+        node (str): The path of the variable node.
+    Returns:
+        str: The name of the topic, usable as the target of a message.
+    """
+    return f"{TOPIC_PREFIX}{publisher}/{node}"
+
+
+def to_topic_messages(messages, publisher: str, subscribers) -> list:
+    """Replace the copies of each variable update sent to the different subscribers with a single message addressed to the topic of the variable.
+
+    The protocol manager builds one update message per subscriber. When the copies of an
+    update are addressed to exactly the current subscribers of the variable and carry the
+    same payload, the first copy is re-addressed to the topic and the others are dropped,
+    so that the bus receives and routes one message per update. Its correlation identifier
+    is reset, as the message does not reply to the subscription of a single subscriber.
+    Otherwise, e.g., when a subscriber joined while the updates were collected, the copies
+    are sent to their subscribers unchanged. The order of the messages is preserved: each
+    topic message takes the place of the first copy of its update.
+
+    Args:
+        messages (Iterable[FrostMessage]): The messages to send, in order.
+        publisher (str): The name of the Frost component owning the variables.
+        subscribers (Callable[[str], set[str]]): Returns the names of the current subscribers of a variable.
+    Returns:
+        list[FrostMessage]: The messages to send.
+    """
+    messages = list(messages)
+    # Number of updates of each node seen per subscriber, to tell apart successive updates of the same node.
+    seen: dict[tuple[str, str], int] = {}
+    copies: dict[tuple[str, int], list] = {}
+    groups = []
+    for message in messages:
+        if message.header.msg_name != VariableMsgName.UPDATE:
+            groups.append(None)
+            continue
+
+        node = message.payload.node
+        key = (message.target, node)
+        occurrence = seen.get(key, 0)
+        seen[key] = occurrence + 1
+        update_copies = copies.get((node, occurrence))
+        if update_copies is None:
+            update_copies = copies[(node, occurrence)] = []
+        update_copies.append(message)
+        groups.append(update_copies)
+
+    multicast = set()
+    for (node, _), update_copies in copies.items():
+        payload = update_copies[0].payload
+        if all(copy.payload == payload for copy in update_copies[1:]) and {copy.target for copy in update_copies} == subscribers(node):
+            multicast.add(id(update_copies))
+
+    result = []
+    for message, update_copies in zip(messages, groups):
+        if update_copies is None or id(update_copies) not in multicast:
+            result.append(message)
+        elif message is update_copies[0]:
+            message.target = topic_name(publisher, message.payload.node)
+            message.correlation_id = message.identifier
+            result.append(message)
+    return result
+
+
+def is_topic(target: str) -> bool:
+    """Check if the target of a message is a topic.
+
+    Args:
+        target (str): The target of the message.
+    Returns:
+        bool: True if the target is a topic, False otherwise.
+    """
+    return target.startswith(TOPIC_PREFIX)
+
+
+class RoutingTable:
+    """Routing table mapping Frost component names to bank indices of a FrostBus.
+
+    The outbound messages of a tag are grouped by destination index in a single pass,
+    so that each output channel is set exactly once with a prebuilt list. Messages
+    addressed to unknown targets are sent to the default route, if any (e.g., the
+    channel connected to a parent bus), or collected in a bounded dead-letter list.
+    Messages addressed to a topic are multicast: the same message is added once to the
+    batch of each channel with at least one subscriber of the topic.
+
+    Args:
+        dead_letter_capacity (int): The maximum number of dead letters retained.
+
+    Attributes:
+        routes (dict[str, int]): A mapping of Frost component names to bank indices.
+        dead_letters (deque): The most recent messages that could not be routed.
+        dead_letter_count (int): The total number of messages that could not be routed.
+        default_route (int | None): The bank index of the messages addressed to unknown targets, None to dead-letter them.
+        topics (dict[str, set[str]]): The names of the subscribers of each topic.
+    """
+
+    def __init__(self, dead_letter_capacity: int = 1024) -> None:
+        self.routes: dict[str, int] = {}
+        self.default_route: int | None = None
+        self.topics: dict[str, set[str]] = {}
+        self.dead_letters: deque = deque(maxlen=dead_letter_capacity)
+        self.dead_letter_count = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.routes
+
+    def __getitem__(self, name: str) -> int:
+        return self.routes[name]
+
+    def __len__(self) -> int:
+        return len(self.routes)
+
+    def register(self, name: str, index: int) -> None:
+        """Register a Frost component at the given bank index.
+
+        Args:
+            name (str): The name of the Frost component.
+            index (int): The bank index the component is connected to.
+        """
+        self.routes[name] = index
+
+    def subscribe(self, topic: str, subscriber: str) -> None:
+        """Add a subscriber to a topic.
+
+        Args:
+            topic (str): The name of the topic.
+            subscriber (str): The name of the subscribed Frost component.
+        """
+        subscribers = self.topics.get(topic)
+        if subscribers is None:
+            self.topics[topic] = {subscriber}
+        else:
+            subscribers.add(subscriber)
+
+    def unsubscribe(self, topic: str, subscriber: str) -> None:
+        """Remove a subscriber from a topic.
+
+        Args:
+            topic (str): The name of the topic.
+            subscriber (str): The name of the unsubscribed Frost component.
+        """
+        subscribers = self.topics.get(topic)
+        if subscribers is None:
+            return
+
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del self.topics[topic]
+
+    def topic_indices(self, topic: str, use_default_route: bool = True) -> set[int] | None:
+        """Returns the bank indices of the subscribers of a topic.
+
+        Args:
+            topic (str): The name of the topic.
+            use_default_route (bool): Whether subscribers with no known route are reached through the default route.
+        Returns:
+            set[int] | None: The bank indices of the subscribers, None if the topic is unknown.
+        """
+        subscribers = self.topics.get(topic)
+        if subscribers is None:
+            return None
+
+        routes = self.routes
+        default_route = self.default_route if use_default_route else None
+        indices = {routes.get(subscriber, default_route) for subscriber in subscribers}
+        indices.discard(None)
+        return indices
+
+    def route(self, messages, use_default_route: bool = True) -> dict[int, list]:
+        """Group the messages by destination bank index.
+
+        Args:
+            messages (Iterable[FrostMessage]): The messages to route.
+            use_default_route (bool): Whether messages addressed to unknown targets can be sent to the default route.
+        Returns:
+            dict[int, list]: The messages to send, grouped by bank index.
+        """
+        routes = self.routes
+        default_route = self.default_route if use_default_route else None
+        batches: dict[int, list] = {}
+        topics = self.topics
+        for message in messages:
+            target = message.target
+            index = routes.get(target)
+            if index is None and target in topics:
+                for index in self.topic_indices(target, use_default_route):
+                    batch = batches.get(index)
+                    if batch is None:
+                        batches[index] = [message]
+                    else:
+                        batch.append(message)
+                continue
+
+            if index is None:
+                index = default_route
+            if index is None:
+                self.dead_letters.append(message)
+                self.dead_letter_count += 1
+                continue
+
+            batch = batches.get(index)
+            if batch is None:
+                batches[index] = [message]
+            else:
+                batch.append(message)
+        return batches
@@ -0,0 +1,126 @@
+import atexit
+import os
+import sys
+import threading
+from collections import Counter
+
+REACTION_PREFIX = "reaction_function_"
+
+
+class SamplingProfiler:
+    """Low-overhead sampling profiler for the reactions of selected reactors.
+
+    A background thread periodically inspects the stack of every thread. When a stack is
+    executing a reaction of a profiled reactor, the stack below the reaction is recorded
+    for that reaction. Reactions are recognized by the name of the functions generated by
+    Lingua Franca, so the generated code does not need to be modified, and reactions are
+    profiled whichever worker thread executes them.
+
+    At exit, a folded stack file (``<reactor>.<reaction>.folded``, one ``stack count`` line per
+    distinct stack, compatible with flame graph tools) is written for each sampled reaction,
+    together with a ``summary.txt`` file listing the hottest functions of each reaction.
+
+    Args:
+        interval (float): The sampling period in seconds.
+        path (str): The directory where the stats files are written.
+    """
+
+    def __init__(self, interval: float = 0.005, path: str = "frost_profile") -> None:
+        if interval <= 0:
+            raise ValueError(f"Invalid sampling interval {interval}.")
+
+        self.interval = interval
+        self.path = path
+        self._reactors: dict[int, str] = {}
+        self._samples: dict[tuple[str, str], Counter] = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add(self, reactor, name: str) -> None:
+        """Start profiling the reactions of a reactor. The sampling thread is started with the first reactor.
+
+        Args:
+            reactor (object): The reactor instance.
+            name (str): The name of the reactor, used to name the stats files.
+        """
+        self._reactors[id(reactor)] = name
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="frost-profiler", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def sample(self) -> None:
+        """Take a sample of the stacks of all the threads."""
+        own_thread = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                if code.co_name.startswith(REACTION_PREFIX):
+                    reactor = self._reactors.get(id(frame.f_locals.get("self")))
+                    if reactor is not None:
+                        key = (reactor, code.co_name)
+                        samples = self._samples.get(key)
+                        if samples is None:
+                            samples = self._samples[key] = Counter()
+                        samples[";".join(reversed(stack))] += 1
+                    break
+                frame = frame.f_back
+
+    def stop(self) -> None:
+        """Stop the sampling thread and write the stats files."""
+        if self._stop.is_set():
+            return
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.dump()
+
+    def dump(self) -> None:
+        """Write the stats files of the sampled reactions."""
+        os.makedirs(self.path, exist_ok=True)
+
+        with open(os.path.join(self.path, "summary.txt"), "w") as summary:
+            for (reactor, reaction), samples in sorted(self._samples.items()):
+                with open(os.path.join(self.path, f"{reactor}.{reaction}.folded"), "w") as folded:
+                    for stack, count in samples.most_common():
+                        folded.write(f"{stack} {count}\n")
+
+                total = sum(samples.values())
+                leaves = Counter()
+                for stack, count in samples.items():
+                    leaves[stack.rsplit(";", 1)[-1]] += count
+
+                summary.write(f"{reactor}.{reaction}: {total} samples (~{total * self.interval:.3f} s)\n")
+                for function, count in leaves.most_common(20):
+                    summary.write(f"    {count:8d} {100 * count / total:6.2f}% {function}\n")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+_profiler = None
+
+
+def get_sampling_profiler(configuration: dict | None = None) -> SamplingProfiler:
+    """Returns the sampling profiler of the program, creating it the first time.
+
+    Args:
+        configuration (dict | None): The ``profiling`` section of the configuration, with the optional ``interval`` and ``path`` keys. A ``{pid}`` placeholder in the path is replaced with the process id.
+    Returns:
+        SamplingProfiler: The sampling profiler.
+    """
+    global _profiler
+    if _profiler is None:
+        configuration = configuration or {}
+        _profiler = SamplingProfiler(
+            interval=configuration.get("interval", 0.005),
+            path=configuration.get("path", "frost_profile").format(pid=os.getpid()),
+        )
+    return _profiler
@@ -0,0 +1,211 @@
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+SIGNAL_MAGIC = b"FSIG"
+SIGNAL_VERSION = 1
+# Shared memory on Linux, a temporary directory elsewhere.
+SIGNAL_DIRECTORY = os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "frost")
+
+# magic, version, type code, capacity
+_HEADER = struct.Struct("<4sBc2xQ")
+# Number of samples written since the creation of the buffer, aligned to 8 bytes.
+_WRITTEN = struct.Struct("<Q")
+_WRITTEN_OFFSET = 16
+_DATA_OFFSET = 64
+# Type codes of the samples that can be exposed as memoryview objects, i.e., all but the unicode ones.
+SIGNAL_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+
+class SignalOverrunError(BufferError):
+    """Raised when the samples of a window have been overwritten by the writer."""
+
+
+def signal_path(owner: str, node: str, directory: str | None = None) -> str:
+    """Returns the path of the file backing the signal buffer of a data model node.
+
+    Args:
+        owner (str): The name of the reactor owning the data model.
+        node (str): The path of the node, e.g., ``machine/vibration``.
+        directory (str | None): The directory of the buffers, defaults to SIGNAL_DIRECTORY.
+    Returns:
+        str: The path of the file.
+    """
+    return os.path.join(directory or SIGNAL_DIRECTORY, f"{owner}-{node.replace('/', '.')}.sig")
+
+
+class SignalBuffer:
+    """Ring buffer of numerical samples in a memory-mapped file, shared between processes.
+
+    The buffer is written by a single writer, which creates the file, and read by any number
+    of readers, which open it read-only. The header stores the total number of samples
+    written, i.e., the watermark of the buffer: sample ``i`` is stored at position
+    ``i % capacity`` and is available while ``written - i <= capacity``.
+
+    Windows are returned as ``memoryview`` segments over the file, without copies, and can
+    be wrapped with ``numpy.frombuffer``. As the writer does not wait for the readers, a
+    reader using a window must check that it was not overwritten with ``overwritten`` once
+    it is done with it, or copy it with ``read``, which checks it.
+
+    Args:
+        path (str): The path of the file backing the buffer.
+        capacity (int | None): The number of samples of the buffer. Required to create the buffer, read from the file otherwise.
+        typecode (str): The ``array`` type code of the samples, used when the buffer is created. One of SIGNAL_TYPECODES.
+        create (bool): If True, the file is created or overwritten and the buffer is opened for writing.
+
+    Attributes:
+        path (str): The path of the file backing the buffer.
+        capacity (int): The number of samples of the buffer.
+        typecode (str): The ``array`` type code of the samples.
+    """
+
+    def __init__(self, path: str, capacity: int | None = None, typecode: str = "d", create: bool = False) -> None:
+        self.path = path
+        self._writable = create
+        if create:
+            if not capacity or capacity < 1:
+                raise ValueError(f"Invalid signal buffer capacity {capacity}, expected a positive value.")
+            if typecode not in SIGNAL_TYPECODES:
+                raise ValueError(f"Invalid signal buffer type code {typecode!r}, expected one of {''.join(sorted(SIGNAL_TYPECODES))}.")
+            itemsize = array(typecode).itemsize
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w+b") as signal_file:
+                signal_file.truncate(_DATA_OFFSET + capacity * itemsize)
+                self._mmap = mmap.mmap(signal_file.fileno(), 0)
+            _HEADER.pack_into(self._mmap, 0, SIGNAL_MAGIC, SIGNAL_VERSION, typecode.encode(), capacity)
+            _WRITTEN.pack_into(self._mmap, _WRITTEN_OFFSET, 0)
+        else:
+            with open(path, "rb") as signal_file:
+                self._mmap = mmap.mmap(signal_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._mmap) < _DATA_OFFSET:
+                self._mmap.close()
+                raise ValueError(f"{path} is not a signal buffer.")
+            magic, version, typecode, capacity = _HEADER.unpack_from(self._mmap, 0)
+            if (magic, version) != (SIGNAL_MAGIC, SIGNAL_VERSION):
+                self._mmap.close()
+                raise ValueError(f"{path} is not a signal buffer of version {SIGNAL_VERSION}.")
+            typecode = typecode.decode()
+            if typecode not in SIGNAL_TYPECODES:
+                self._mmap.close()
+                raise ValueError(f"{path} is a signal buffer of invalid type code {typecode!r}.")
+
+        self.capacity = capacity
+        self.typecode = typecode
+        self._data = memoryview(self._mmap)[_DATA_OFFSET:_DATA_OFFSET + capacity * array(typecode).itemsize]
+        self._samples = self._data.cast(typecode)
+
+    @property
+    def written(self) -> int:
+        """The number of samples written since the creation of the buffer."""
+        return _WRITTEN.unpack_from(self._mmap, _WRITTEN_OFFSET)[0]
+
+    def append(self, samples) -> int:
+        """Append samples to the buffer, overwriting the oldest ones. Only the writer can append.
+
+        Args:
+            samples (Iterable[int | float] | buffer): The samples, e.g., a list, an ``array.array`` or a one-dimensional NumPy array with the type code of the buffer.
+        Returns:
+            int: The number of samples written since the creation of the buffer.
+        """
+        if not self._writable:
+            raise BufferError(f"Signal buffer {self.path} is opened read-only.")
+
+        try:
+            view = memoryview(samples)
+        except TypeError:
+            view = None
+        if view is None or view.format != self.typecode or not view.c_contiguous:
+            view = memoryview(array(self.typecode, samples))
+        data = view.cast("B")
+
+        itemsize = self._samples.itemsize
+        count = len(data) // itemsize
+        written = self.written
+        # Only the last samples fit in the buffer.
+        skipped = max(count - self.capacity, 0)
+        data = data[skipped * itemsize:]
+        position = (written + skipped) % self.capacity * itemsize
+        first = min(len(data), len(self._data) - position)
+        self._data[position:position + first] = data[:first]
+        self._data[:len(data) - first] = data[first:]
+
+        # The watermark is published after the samples.
+        written += count
+        _WRITTEN.pack_into(self._mmap, _WRITTEN_OFFSET, written)
+        return written
+
+    def window(self, start: int, end: int | None = None) -> list:
+        """Returns the samples between two watermarks, without copies.
+
+        Args:
+            start (int): The index of the first sample.
+            end (int | None): The index after the last sample, defaults to the current watermark.
+        Returns:
+            list[memoryview]: The samples, in one segment or in two segments if the window wraps around the end of the buffer.
+        Raises:
+            SignalOverrunError: If the first samples have already been overwritten.
+            ValueError: If the window ends after the watermark.
+        """
+        written = self.written
+        end = written if end is None else end
+        if start > end or end > written:
+            raise ValueError(f"Invalid window [{start}, {end}) of signal buffer {self.path}, {written} samples written.")
+        if self.overwritten(start, written):
+            raise SignalOverrunError(f"Samples from {start} of signal buffer {self.path} overwritten, {written} samples written.")
+        if start == end:
+            return []
+
+        position = start % self.capacity
+        first = min(end - start, self.capacity - position)
+        segments = [self._samples[position:position + first]]
+        if first < end - start:
+            segments.append(self._samples[:end - start - first])
+        return segments
+
+    def read(self, start: int, end: int | None = None) -> array:
+        """Returns a copy of the samples between two watermarks.
+
+        Args:
+            start (int): The index of the first sample.
+            end (int | None): The index after the last sample, defaults to the current watermark.
+        Returns:
+            array: The samples.
+        Raises:
+            SignalOverrunError: If some samples have been overwritten before or while being copied.
+            ValueError: If the window ends after the watermark.
+        """
+        samples = array(self.typecode)
+        for segment in self.window(start, end):
+            with segment, segment.cast("B") as data:
+                samples.frombytes(data)
+        if self.overwritten(start):
+            raise SignalOverrunError(f"Samples from {start} of signal buffer {self.path} overwritten while being read.")
+        return samples
+
+    def overwritten(self, start: int, written: int | None = None) -> bool:
+        """Returns True if the sample with the given index is not in the buffer anymore.
+
+        Args:
+            start (int): The index of the sample.
+            written (int | None): The watermark to check against, defaults to the current one.
+        """
+        return (self.written if written is None else written) - start > self.capacity
+
+    def close(self, unlink: bool = False) -> None:
+        """Close the buffer. The windows returned by ``window`` must be released first.
+
+        Args:
+            unlink (bool): If True, the file backing the buffer is removed.
+        """
+        self._samples.release()
+        self._data.release()
+        self._mmap.close()
+        if unlink:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
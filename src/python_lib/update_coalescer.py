@@ -0,0 +1,88 @@
+from numbers import Real
+
+from machine_data_model.protocols.frost_v1.frost_header import VariableMsgName
+
+
+class UpdateCoalescer:
+    """Coalesce the variable update messages sent to the subscribers of a data model within a flush window.
+
+    Only the latest update per subscriber and node is kept. Numerical updates can also be
+    filtered with a deadband: an update is dropped if its value differs from the last value
+    sent to the same subscriber by less than the deadband of the node. Messages that are not
+    variable updates are never dropped, and are returned before the updates.
+
+    The counters are also added to the ``updates_merged``, ``updates_filtered`` and
+    ``updates_sent`` counters of the instrumentation, if enabled.
+
+    Args:
+        deadbands (dict[str, float] | None): The deadbands of the numerical variables, indexed by node path.
+        metrics (ReactorMetrics | None): The instrumentation counters of the reactor, None if the instrumentation is disabled.
+
+    Attributes:
+        deadbands (dict[str, float]): The deadbands of the numerical variables, indexed by node path.
+        merged (int): The number of updates replaced by a newer update within the same flush window.
+        filtered (int): The number of updates dropped by the deadband filter.
+        sent (int): The number of messages returned for sending.
+    """
+
+    def __init__(self, deadbands: dict | None = None, metrics=None) -> None:
+        self.deadbands = dict(deadbands or {})
+        self.metrics = metrics
+        self.merged = 0
+        self.filtered = 0
+        self.sent = 0
+        self._last_sent: dict[tuple[str, str], Real] = {}
+
+    def coalesce(self, messages) -> list:
+        """Coalesce the messages of a flush window.
+
+        Args:
+            messages (Iterable[FrostMessage]): The messages to send, in order.
+        Returns:
+            list[FrostMessage]: The messages to send, with the updates in order of their latest occurrence.
+        """
+        coalesced = []
+        latest = {}
+        merged = 0
+        for message in messages:
+            if message.header.msg_name != VariableMsgName.UPDATE:
+                coalesced.append(message)
+                continue
+
+            key = (message.target, message.payload.node)
+            if key in latest:
+                del latest[key]
+                merged += 1
+            latest[key] = message
+
+        deadbands = self.deadbands
+        last_sent = self._last_sent
+        filtered = 0
+        for key, message in latest.items():
+            if deadbands and key[1] in deadbands:
+                value = message.payload.value
+                if isinstance(value, Real) and not isinstance(value, bool):
+                    previous = last_sent.get(key)
+                    if previous is not None and abs(value - previous) < deadbands[key[1]]:
+                        filtered += 1
+                        continue
+                    last_sent[key] = value
+
+            coalesced.append(message)
+
+        self.merged += merged
+        self.filtered += filtered
+        self.sent += len(coalesced)
+        if self.metrics is not None:
+            self.metrics.increment("updates_merged", merged)
+            self.metrics.increment("updates_filtered", filtered)
+            self.metrics.increment("updates_sent", len(coalesced))
+        return coalesced
+
+    def counters(self) -> dict:
+        """Returns the counters of the coalescer.
+
+        Returns:
+            dict[str, int]: The number of merged, filtered and sent messages.
+        """
+        return {"merged": self.merged, "filtered": self.filtered, "sent": self.sent}